@@ -0,0 +1,34 @@
+"""JSON encoding/decoding for the probe wire protocol, using orjson when installed."""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj: object) -> str:
+        """Serialize *obj* to a compact JSON string (orjson fast path)."""
+        return orjson.dumps(obj).decode()
+
+    def loads(data: str | bytes) -> object:
+        """Parse a JSON document (orjson fast path).
+
+        Raises orjson.JSONDecodeError, a subclass of json.JSONDecodeError.
+        """
+        return orjson.loads(data)
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def dumps(obj: object) -> str:
+        """Serialize *obj* to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(data: str | bytes) -> object:
+        """Parse a JSON document."""
+        return json.loads(data)
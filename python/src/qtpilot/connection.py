@@ -3,16 +3,34 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 import warnings
 from collections.abc import Callable
 
 from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosedOK
+
+from qtpilot import _json
 
 logger = logging.getLogger(__name__)
 
+# Encoded '{"jsonrpc":"2.0","method":...,"params":{},"id":' per method, so
+# calls without params only need the id appended.
+_EMPTY_PARAMS_PREFIXES: dict[str, str] = {}
+
+
+def _encode_request(request: dict) -> str:
+    """Encode a request dict, reusing a cached prefix when params are empty."""
+    if request["params"]:
+        return _json.dumps(request)
+    method = request["method"]
+    prefix = _EMPTY_PARAMS_PREFIXES.get(method)
+    if prefix is None:
+        skeleton = _json.dumps({"jsonrpc": "2.0", "method": method, "params": {}})
+        prefix = _EMPTY_PARAMS_PREFIXES[method] = skeleton[:-1] + ',"id":'
+    return f"{prefix}{request['id']}}}"
+
 
 class ProbeError(Exception):
     """Error returned by the qtPilot probe via JSON-RPC."""
@@ -138,6 +156,7 @@ class ProbeConnection:
             ping_interval=10,   # send ping every 10s to keep connection alive
             ping_timeout=30,    # allow 30s for pong response
             close_timeout=5,    # 5s grace period on close
+            # permessage-deflate is offered by default (compression="deflate")
         )
         self._connected = True
         self._recv_task = asyncio.create_task(self._recv_loop())
@@ -207,7 +226,7 @@ class ProbeConnection:
 
         t0 = time.monotonic()
         try:
-            await self._ws.send(json.dumps(request))
+            await self._ws.send(_encode_request(request))
             logger.debug("Sent request id=%d method=%s", request_id, method)
             self._notify_send_observers(request)
             result = await future
@@ -223,18 +242,46 @@ class ProbeConnection:
             self._notify_call_observers(request, result, duration_ms)
             return result
 
+    async def call_many(
+        self, calls: list[tuple[str, dict | None]]
+    ) -> list[dict | BaseException]:
+        """Send several JSON-RPC requests back-to-back and wait for all responses.
+
+        All requests are written to the socket before any response is awaited,
+        so N calls cost roughly one round trip instead of N. Responses are
+        matched by ID as usual.
+
+        Args:
+            calls: (method, params) pairs, sent in order.
+
+        Returns:
+            One entry per call, in order: the result dict, or the exception
+            raised for that call. This may be a BaseException such as
+            asyncio.CancelledError, not only an Exception like ProbeError.
+        """
+        return await asyncio.gather(
+            *(self.call(method, params) for method, params in calls),
+            return_exceptions=True,
+        )
+
     async def _recv_loop(self) -> None:
         """Background task that reads WebSocket messages and resolves futures."""
+        ws = self._ws
+        pending = self._pending
         try:
-            async for raw in self._ws:
+            while True:
+                # Take text frames undecoded: the JSON parser reads UTF-8 bytes
+                # directly, so no intermediate str is built per frame.
+                raw = await ws.recv(decode=False)
                 try:
-                    msg = json.loads(raw)
-                except (json.JSONDecodeError, TypeError):
+                    msg = _json.loads(raw)
+                except (ValueError, TypeError):  # JSONDecodeError, bad UTF-8
                     logger.debug("Ignoring non-JSON message")
                     continue
 
                 msg_id = msg.get("id")
-                if msg_id is None or msg_id not in self._pending:
+                future = None if msg_id is None else pending.pop(msg_id, None)
+                if future is None:
                     # JSON-RPC notification (no id, has method)
                     method = msg.get("method")
                     if method:
@@ -244,11 +291,10 @@ class ProbeConnection:
                             )
                         except asyncio.QueueFull:
                             self._notification_drops += 1
-                    elif not method:
+                    else:
                         logger.debug("Ignoring message with id=%s", msg_id)
                     continue
 
-                future = self._pending.pop(msg_id)
                 if future.done():
                     continue
 
@@ -259,6 +305,8 @@ class ProbeConnection:
 
         except asyncio.CancelledError:
             raise
+        except ConnectionClosedOK:
+            logger.debug("WebSocket connection closed normally")
         except Exception as exc:
             # Log close code/reason if available (websockets.ConnectionClosed)
             close_code = getattr(getattr(exc, "rcvd", None), "code", None)
@@ -280,14 +328,27 @@ class ProbeConnection:
         try:
             while True:
                 method, params = await self._notification_queue.get()
-                for handler in list(self._notification_handlers):
-                    try:
-                        handler(method, params)
-                    except Exception:
-                        logger.debug("Notification handler error", exc_info=True)
+                try:
+                    self._dispatch_notification(method, params)
+                finally:
+                    self._notification_queue.task_done()
         except asyncio.CancelledError:
             pass
 
+    async def wait_idle(self) -> None:
+        """Wait until every notification queued so far has been dispatched."""
+        await self._notification_queue.join()
+
+    def _dispatch_notification(self, method: str, params: dict) -> None:
+        """Call every current notification handler with (method, params)."""
+        if not self._notification_handlers:
+            return
+        for handler in list(self._notification_handlers):
+            try:
+                handler(method, params)
+            except Exception:
+                logger.debug("Notification handler error", exc_info=True)
+
     @property
     def notification_drops(self) -> int:
         """Number of notifications dropped due to full queue."""
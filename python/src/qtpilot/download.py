@@ -6,35 +6,65 @@ archive for your Qt version and platform.
 
 from __future__ import annotations
 
-import hashlib
+import functools
+import mmap
+import os
+import re
 import sys
 import tarfile
 import urllib.error
-import urllib.request
 import zipfile
+from collections.abc import Callable, Iterable
 from importlib.metadata import version as _pkg_version
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import hashlib
+    from concurrent.futures import Future
 
 # GitHub repository for qtPilot releases
 GITHUB_REPO = "ssss2art/qtPilot"
 RELEASES_URL = f"https://github.com/{GITHUB_REPO}/releases/download"
+_URL_TEMPLATE = RELEASES_URL + "/{tag}/{filename}"
+
+# "major.minor" followed by optional extra components and a "-patched" suffix.
+# DOTALL so extra components are dropped even when they hold a newline, as in
+# "6.8.0\n" read from a file.
+_VERSION_RE = re.compile(
+    r"(?P<base>[^.]*\.[^.]*?)(?:\..*?)?(?P<patched>-patched)?", re.DOTALL
+)
+
+# Files at least this large are hashed through mmap in one C call; below it
+# the mapping setup costs more than it saves.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
 
+# Read size for streaming downloads. Release archives are several MiB, so a
+# large chunk keeps the read/write/hash loop to a handful of iterations.
+_CHUNK_SIZE = 1024 * 1024
 
+
+@functools.cache
 def _default_release_tag() -> str:
-    """Derive the default release tag from the installed package version."""
+    """Derive the default release tag from the installed package version.
+
+    Cached: reading package metadata scans sys.path, and the installed
+    version does not change while the process runs.
+    """
     v = _pkg_version("qtpilot")
     # Strip dev/post/local suffixes for a clean release tag
     base = v.split(".dev")[0].split("+")[0].split(".post")[0]
     return f"v{base}"
 
-# Available Qt versions (release workflow builds these)
-AVAILABLE_VERSIONS = frozenset([
+# Available Qt versions (release workflow builds these). Entries are interned,
+# as is normalize_version()'s result, so membership checks hit identity.
+AVAILABLE_VERSIONS = frozenset(sys.intern(v) for v in (
     "5.15",
     "5.15-patched",
     "6.5",
     "6.8",
     "6.9",
-])
+))
 
 
 def latest_version() -> str:
@@ -69,9 +99,12 @@ class VersionNotFoundError(DownloadError):
     """Raised when the requested Qt version is not available."""
 
 
+@functools.cache
 def detect_platform() -> str:
     """Detect the current platform name.
 
+    The result is cached: sys.platform is constant for the process.
+
     Returns:
         Platform name string: "linux" or "windows"
 
@@ -148,23 +181,11 @@ def normalize_version(qt_version: str) -> str:
     Returns:
         Normalized version like "6.8" or "5.15-patched"
     """
-    # Handle patched suffix
-    patched = qt_version.endswith("-patched")
-    if patched:
-        qt_version = qt_version[:-8]  # Remove "-patched"
-
-    # Split and normalize (e.g., "6.8.0" -> "6.8")
-    parts = qt_version.split(".")
-    if len(parts) >= 2:
-        normalized = f"{parts[0]}.{parts[1]}"
-    else:
-        normalized = qt_version
-
-    # Re-add patched suffix if present
-    if patched:
-        normalized = f"{normalized}-patched"
-
-    return normalized
+    match = _VERSION_RE.fullmatch(qt_version)
+    if match is None:
+        return sys.intern(qt_version)
+    # Keep major.minor (e.g. "6.8.0" -> "6.8") and any patched suffix
+    return sys.intern(match["base"] + (match["patched"] or ""))
 
 
 def get_archive_filename(
@@ -236,7 +257,13 @@ def build_archive_url(
     if release_tag == "latest":
         release_tag = _default_release_tag()
 
-    return f"{RELEASES_URL}/{release_tag}/{filename}"
+    return _assemble_url(release_tag, filename)
+
+
+@functools.lru_cache(maxsize=128)
+def _assemble_url(tag: str, filename: str) -> str:
+    """Format a release asset URL; cached since callers repeat the same few."""
+    return _URL_TEMPLATE.format(tag=tag, filename=filename)
 
 
 def build_checksums_url(release_tag: str = "latest") -> str:
@@ -250,7 +277,7 @@ def build_checksums_url(release_tag: str = "latest") -> str:
     """
     if release_tag == "latest":
         release_tag = _default_release_tag()
-    return f"{RELEASES_URL}/{release_tag}/SHA256SUMS"
+    return _assemble_url(release_tag, "SHA256SUMS")
 
 
 def parse_checksums(content: str) -> dict[str, str]:
@@ -263,19 +290,30 @@ def parse_checksums(content: str) -> dict[str, str]:
         Dict mapping filename to SHA256 hash
     """
     checksums = {}
-    for line in content.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
+    for line in content.splitlines():
         # Format: "hash  filename" or "hash *filename" (binary mode)
-        parts = line.split()
-        if len(parts) >= 2:
-            hash_value = parts[0]
-            filename = parts[-1].lstrip("*")
+        # Split on the first run of any whitespace, so tab separators work too.
+        parts = line.split(None, 1)
+        if len(parts) < 2:
+            continue
+        hash_value, filename = parts
+        filename = filename.strip().lstrip("*")
+        if filename:
             checksums[filename] = hash_value
     return checksums
 
 
+def _integrity_sha256(data: bytes = b"") -> hashlib._Hash:
+    """Create a SHA256 hash object for download integrity checks.
+
+    The digests only detect corrupted or swapped archives, so they are marked
+    as not used for security; FIPS-restricted OpenSSL builds then allow them.
+    """
+    import hashlib
+
+    return hashlib.sha256(data, usedforsecurity=False)
+
+
 def verify_checksum(filepath: Path, expected_hash: str) -> bool:
     """Verify file SHA256 checksum.
 
@@ -286,35 +324,64 @@ def verify_checksum(filepath: Path, expected_hash: str) -> bool:
     Returns:
         True if checksum matches
     """
-    sha256 = hashlib.sha256()
+    expected_hash = expected_hash.strip().lower()
+    # A malformed digest can never match, so don't read the file for it
+    if len(expected_hash) != 64:
+        return False
+    try:
+        bytes.fromhex(expected_hash)
+    except ValueError:
+        return False
+
+    import hashlib
+
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest().lower() == expected_hash.lower()
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = _integrity_sha256(mm).hexdigest()
+        else:
+            digest = hashlib.file_digest(f, _integrity_sha256).hexdigest()
+    return digest == expected_hash
 
 
-def download_file(url: str, output_path: Path) -> None:
+def download_file(
+    url: str, output_path: Path, *, abort_check: Callable[[], object] | None = None
+) -> str:
     """Download a file from URL.
 
+    The SHA256 is computed while streaming, so callers can verify the file
+    without reading it back from disk.
+
     Args:
         url: URL to download
         output_path: Local path to save file
+        abort_check: Called after each chunk; an exception it raises stops
+            the download and propagates unchanged
+
+    Returns:
+        SHA256 hex digest (lowercase) of the downloaded bytes
 
     Raises:
         DownloadError: If download fails
     """
+    import urllib.request
+
     try:
         # Create parent directories if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Download with progress indication
+        sha256 = _integrity_sha256()
+        # Reuse one buffer for every chunk instead of allocating bytes per read.
+        buf = memoryview(bytearray(_CHUNK_SIZE))
         with urllib.request.urlopen(url, timeout=60) as response:
             with open(output_path, "wb") as f:
-                while True:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
+                while n := response.readinto(buf):
+                    chunk = buf[:n]
                     f.write(chunk)
+                    sha256.update(chunk)
+                    if abort_check is not None:
+                        abort_check()
+        return sha256.hexdigest()
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise DownloadError(f"File not found: {url}") from e
@@ -393,6 +460,56 @@ def extract_archive(archive_path: Path, output_dir: Path) -> list[Path]:
     return extracted
 
 
+def _fetch_checksums(release_tag: str) -> dict[str, str]:
+    """Download and parse the SHA256SUMS file for a release.
+
+    Raises:
+        DownloadError: If the file cannot be downloaded
+    """
+    import urllib.request
+
+    checksums_url = build_checksums_url(release_tag)
+    try:
+        with urllib.request.urlopen(checksums_url, timeout=30) as response:
+            checksums_content = response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            raise DownloadError(
+                f"SHA256SUMS not found for release {release_tag}"
+            ) from e
+        raise DownloadError(
+            f"Error downloading checksums: HTTP {e.code}"
+        ) from e
+    except urllib.error.URLError as e:
+        raise DownloadError(
+            f"Network error downloading checksums: {e.reason}"
+        ) from e
+    return parse_checksums(checksums_content)
+
+
+def _fetch_checksums_in_background(release_tag: str) -> Future[dict[str, str]]:
+    """Start _fetch_checksums() on a daemon thread and return its future.
+
+    Daemon, so a fetch still waiting on the network never holds up
+    interpreter exit once the caller has given up on it.
+    """
+    import threading
+    from concurrent.futures import Future
+
+    future: Future[dict[str, str]] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_fetch_checksums(release_tag))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="qtpilot-sha256sums", daemon=True).start()
+    return future
+
+
 def download_and_extract(
     qt_version: str,
     output_dir: Path | str | None = None,
@@ -400,6 +517,8 @@ def download_and_extract(
     release_tag: str = "latest",
     platform_name: str | None = None,
     arch: str | None = None,
+    *,
+    checksums: dict[str, str] | None = None,
 ) -> tuple[Path, Path]:
     """Download and extract the qtPilot tools archive for a Qt version.
 
@@ -413,6 +532,7 @@ def download_and_extract(
         release_tag: Release tag to download from (default: "latest")
         platform_name: Platform name (auto-detected if None)
         arch: Target architecture ("x64" or "x86"). Defaults to "x64".
+        checksums: Already parsed SHA256SUMS for the release; fetched if None
 
     Returns:
         Tuple of (probe_path, launcher_path) pointing to extracted files
@@ -441,43 +561,45 @@ def download_and_extract(
     output_dir.mkdir(parents=True, exist_ok=True)
     archive_path = output_dir / archive_filename
 
-    # Download checksums first if verification enabled
-    expected_hash: str | None = None
-    if verify:
-        checksums_url = build_checksums_url(release_tag)
-        try:
-            with urllib.request.urlopen(checksums_url, timeout=30) as response:
-                checksums_content = response.read().decode("utf-8")
-            checksums = parse_checksums(checksums_content)
+    # Fetch SHA256SUMS in the background while the archive downloads. The
+    # archive is hashed in-stream, so the expected value is only needed once
+    # the download has finished; a failed fetch aborts the download at the
+    # next chunk. No thread is started when there is nothing to fetch.
+    pending_checksums = None
+    abort_check = None
+    if verify and checksums is None:
+        pending_checksums = _fetch_checksums_in_background(release_tag)
+
+        def abort_check() -> None:
+            if pending_checksums.done():
+                pending_checksums.result()  # re-raises a failed fetch
+
+    # Download archive to a .part file, hashing it in the same pass; it only
+    # takes the archive name once it has downloaded and verified completely,
+    # so nothing unverified is ever extracted.
+    part_path = archive_path.with_name(archive_filename + ".part")
+    try:
+        actual_hash = download_file(archive_url, part_path, abort_check=abort_check)
+        if verify:
+            if pending_checksums is not None:
+                checksums = pending_checksums.result()
             expected_hash = checksums.get(archive_filename)
             if expected_hash is None:
                 raise DownloadError(
                     f"Checksum not found for {archive_filename} in SHA256SUMS"
                 )
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise DownloadError(
-                    f"SHA256SUMS not found for release {release_tag}"
-                ) from e
-            raise DownloadError(
-                f"Error downloading checksums: HTTP {e.code}"
-            ) from e
-        except urllib.error.URLError as e:
-            raise DownloadError(
-                f"Network error downloading checksums: {e.reason}"
-            ) from e
-
-    # Download archive
-    download_file(archive_url, archive_path)
-
-    # Verify checksum if enabled
-    if verify and expected_hash:
-        if not verify_checksum(archive_path, expected_hash):
-            archive_path.unlink(missing_ok=True)
-            raise ChecksumError(
-                f"Checksum verification failed for {archive_filename}. "
-                "File may be corrupted or tampered with."
-            )
+            if actual_hash != expected_hash.lower():
+                raise ChecksumError(
+                    f"Checksum verification failed for {archive_filename}. "
+                    "File may be corrupted or tampered with."
+                )
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        # Drop a fetch that has not started; a running one is on a daemon thread
+        if pending_checksums is not None:
+            pending_checksums.cancel()
+        raise
+    os.replace(part_path, archive_path)
 
     # Extract archive
     try:
@@ -499,3 +621,61 @@ def download_and_extract(
     launcher_path = output_dir / get_launcher_filename(platform_name)
 
     return probe_path, launcher_path
+
+
+def download_many(
+    qt_versions: Iterable[str],
+    output_dir: Path | str | None = None,
+    verify: bool = True,
+    release_tag: str = "latest",
+    platform_name: str | None = None,
+    arch: str | None = None,
+    max_workers: int = 4,
+) -> dict[str, tuple[Path, Path]]:
+    """Download and extract the tools archives for several Qt versions.
+
+    SHA256SUMS is fetched once for the release and the archives are
+    downloaded concurrently. Every version extracts the same file names,
+    so each goes into its own subdirectory named after the version.
+
+    Args:
+        qt_versions: Qt versions (e.g., ["5.15", "6.8"])
+        output_dir: Parent directory for the per-version directories
+            (default: current directory)
+        verify: Whether to verify SHA256 checksums (default: True)
+        release_tag: Release tag to download from (default: "latest")
+        platform_name: Platform name (auto-detected if None)
+        arch: Target architecture ("x64" or "x86"). Defaults to "x64".
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Dict mapping each normalized version to (probe_path, launcher_path)
+
+    Raises:
+        DownloadError: If any download or extraction fails
+        ChecksumError: If any checksum verification fails
+        VersionNotFoundError: If a Qt version is not available
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    versions = list(dict.fromkeys(normalize_version(v) for v in qt_versions))
+    output_dir = Path.cwd() if output_dir is None else Path(output_dir)
+    if platform_name is None:
+        platform_name = detect_platform()
+    if release_tag == "latest":
+        release_tag = _default_release_tag()
+    checksums = _fetch_checksums(release_tag) if verify and versions else None
+
+    def download_one(version: str) -> tuple[Path, Path]:
+        return download_and_extract(
+            version,
+            output_dir=output_dir / version,
+            verify=verify,
+            release_tag=release_tag,
+            platform_name=platform_name,
+            arch=arch,
+            checksums=checksums,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(versions, pool.map(download_one, versions)))
@@ -2,47 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from qtpilot.connection import ProbeConnection
 
 logger = logging.getLogger(__name__)
 
 # Maps Qt class names to their most useful interactive signals.
-# When a target specifies signals=None, these defaults are used.
-INTERACTIVE_SIGNALS: dict[str, list[str]] = {
-    "QPushButton": ["clicked", "toggled"],
-    "QToolButton": ["clicked", "toggled", "triggered"],
-    "QAction": ["triggered", "toggled"],
-    "QLineEdit": ["textChanged", "textEdited"],
-    "QTextEdit": ["textChanged"],
-    "QPlainTextEdit": ["textChanged"],
-    "QCheckBox": ["stateChanged", "toggled"],
-    "QRadioButton": ["toggled"],
-    "QComboBox": ["currentIndexChanged", "currentTextChanged"],
-    "QSlider": ["valueChanged"],
-    "QSpinBox": ["valueChanged"],
-    "QDoubleSpinBox": ["valueChanged"],
-    "QDial": ["valueChanged"],
-    "QTabWidget": ["currentChanged"],
-    "QTabBar": ["currentChanged"],
-    "QListView": ["clicked", "doubleClicked", "activated"],
-    "QTreeView": ["clicked", "doubleClicked", "activated", "expanded", "collapsed"],
-    "QTableView": ["clicked", "doubleClicked", "activated"],
-    "QListWidget": ["currentItemChanged", "itemClicked", "itemDoubleClicked"],
-    "QTreeWidget": ["currentItemChanged", "itemClicked", "itemDoubleClicked"],
-    "QTableWidget": ["currentCellChanged", "cellClicked", "cellDoubleClicked"],
-    "QMenu": ["triggered"],
-    "QMenuBar": ["triggered"],
-}
+# When a target specifies signals=None, these defaults are used. The table is
+# read-only, which keeps the per-class cache in _signals_for_class valid, and
+# tuples keep the subscription order stable.
+INTERACTIVE_SIGNALS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "QPushButton": ("clicked", "toggled"),
+    "QToolButton": ("clicked", "toggled", "triggered"),
+    "QAction": ("triggered", "toggled"),
+    "QLineEdit": ("textChanged", "textEdited"),
+    "QTextEdit": ("textChanged",),
+    "QPlainTextEdit": ("textChanged",),
+    "QCheckBox": ("stateChanged", "toggled"),
+    "QRadioButton": ("toggled",),
+    "QComboBox": ("currentIndexChanged", "currentTextChanged"),
+    "QSlider": ("valueChanged",),
+    "QSpinBox": ("valueChanged",),
+    "QDoubleSpinBox": ("valueChanged",),
+    "QDial": ("valueChanged",),
+    "QTabWidget": ("currentChanged",),
+    "QTabBar": ("currentChanged",),
+    "QListView": ("clicked", "doubleClicked", "activated"),
+    "QTreeView": ("clicked", "doubleClicked", "activated", "expanded", "collapsed"),
+    "QTableView": ("clicked", "doubleClicked", "activated"),
+    "QListWidget": ("currentItemChanged", "itemClicked", "itemDoubleClicked"),
+    "QTreeWidget": ("currentItemChanged", "itemClicked", "itemDoubleClicked"),
+    "QTableWidget": ("currentCellChanged", "cellClicked", "cellDoubleClicked"),
+    "QMenu": ("triggered",),
+    "QMenuBar": ("triggered",),
+})
 
 # Fallback signals to try when the class isn't in INTERACTIVE_SIGNALS.
-FALLBACK_SIGNALS = ["clicked", "toggled", "triggered"]
+FALLBACK_SIGNALS: tuple[str, ...] = ("clicked", "toggled", "triggered")
+
+# Bound once so the per-notification clock read skips the time module lookup.
+_monotonic_ns = time.monotonic_ns
+
+# Above this many buffered events, stop() converts them to dicts in a worker
+# thread so a long recording doesn't stall the event loop.
+_OFFLOAD_MIN_EVENTS = 10_000
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetSpec:
     """Specifies which object to record and optionally which signals."""
 
@@ -51,39 +65,77 @@ class TargetSpec:
     recursive: bool = False
 
 
-@dataclass
+# Events are compared by identity: nothing compares them by value, and
+# field-wise __eq__ on a buffer of thousands of events is never wanted.
+@dataclass(slots=True, eq=False)
 class RecordedEvent:
     """A single captured event with a timestamp relative to recording start."""
 
-    timestamp: float  # seconds since recording started
+    timestamp: int  # milliseconds since recording started
     event_type: str  # "signal", "object_created", "object_destroyed"
     object_id: str  # hierarchical object ID
     object_name: str | None = None  # QObject::objectName if non-empty
     detail: str = ""  # signal name or class name
-    arguments: list = field(default_factory=list)
+    # Signal arguments. Events without any share the immutable () default
+    # rather than each allocating an empty list; to_dict() emits a list.
+    arguments: list = ()
 
     def to_dict(self) -> dict:
         """Convert to compact output format matching the spec."""
-        d: dict = {
-            "t": round(self.timestamp, 3),
-            "type": self.event_type,
-            "object": self.object_id,
+        return _EVENT_DICT_BUILDERS.get(self.event_type, _event_dict)(self)
+
+
+# RecordedEvent.to_dict() builders, one per event type, so serializing a long
+# recording runs a straight-line builder per event rather than the type checks.
+# Keys keep the order t, type, object, name, then the type-specific fields.
+
+def _event_dict(e: RecordedEvent) -> dict:
+    """Common fields, e.g. for object_destroyed."""
+    if e.object_name:
+        return {
+            "t": e.timestamp / 1000, "type": e.event_type,
+            "object": e.object_id, "name": e.object_name,
         }
-        if self.object_name:
-            d["name"] = self.object_name
-        if self.event_type == "signal":
-            d["signal"] = self.detail
-            d["args"] = self.arguments
-        elif self.event_type == "object_created":
-            d["class"] = self.detail
-        return d
+    return {"t": e.timestamp / 1000, "type": e.event_type, "object": e.object_id}
 
 
-@dataclass
+def _signal_dict(e: RecordedEvent) -> dict:
+    """Fields for a signal event."""
+    if e.object_name:
+        return {
+            "t": e.timestamp / 1000, "type": "signal", "object": e.object_id,
+            "name": e.object_name, "signal": e.detail, "args": e.arguments or [],
+        }
+    return {
+        "t": e.timestamp / 1000, "type": "signal", "object": e.object_id,
+        "signal": e.detail, "args": e.arguments or [],
+    }
+
+
+def _created_dict(e: RecordedEvent) -> dict:
+    """Fields for an object_created event."""
+    if e.object_name:
+        return {
+            "t": e.timestamp / 1000, "type": "object_created", "object": e.object_id,
+            "name": e.object_name, "class": e.detail,
+        }
+    return {
+        "t": e.timestamp / 1000, "type": "object_created", "object": e.object_id,
+        "class": e.detail,
+    }
+
+
+_EVENT_DICT_BUILDERS: dict[str, Callable[[RecordedEvent], dict]] = {
+    "signal": _signal_dict,
+    "object_created": _created_dict,
+}
+
+
+@dataclass(slots=True, eq=False)
 class RecordedInputEvent:
     """A single captured QEvent from the global event filter."""
 
-    timestamp: float  # seconds since recording started
+    timestamp: int  # milliseconds since recording started
     event_type: str  # e.g. "MouseButtonPress", "KeyPress", "FocusIn"
     object_id: str  # hierarchical object ID
     object_name: str | None = None
@@ -93,7 +145,7 @@ class RecordedInputEvent:
     def to_dict(self) -> dict:
         """Convert to compact output format."""
         d: dict = {
-            "t": round(self.timestamp, 3),
+            "t": self.timestamp / 1000,
             "type": "event",
             "event": self.event_type,
             "object": self.object_id,
@@ -105,17 +157,32 @@ class RecordedInputEvent:
         return d
 
 
+def _events_to_dicts(events: Iterable[RecordedEvent | RecordedInputEvent]) -> list[dict]:
+    """Convert recorded events to their output dicts."""
+    return [e.to_dict() for e in events]
+
+
 class EventRecorder:
     """Buffers probe notifications between start() and stop() calls."""
 
     def __init__(self) -> None:
         self._recording: bool = False
-        self._start_time: float = 0.0
-        self._events: list[RecordedEvent | RecordedInputEvent] = []
+        self._start_ns: int = 0  # time.monotonic_ns() at start()
+        self._events: deque[RecordedEvent | RecordedInputEvent] = deque()
         self._subscriptions: list[str] = []  # subscription IDs for cleanup
-        self._include_lifecycle: bool = True
+        self._recorders = self._RECORDERS  # set via _include_lifecycle
         self._capture_events: bool = False
 
+    @property
+    def _include_lifecycle(self) -> bool:
+        return self._recorders is self._RECORDERS
+
+    @_include_lifecycle.setter
+    def _include_lifecycle(self, enabled: bool) -> None:
+        # Fixed for a whole session, so pick the dispatch table once rather
+        # than testing the flag on every lifecycle notification.
+        self._recorders = self._RECORDERS if enabled else self._SIGNAL_RECORDERS
+
     @property
     def is_recording(self) -> bool:
         return self._recording
@@ -131,7 +198,7 @@ class EventRecorder:
             "event_count": len(self._events),
         }
         if self._recording:
-            result["duration"] = round(time.monotonic() - self._start_time, 3)
+            result["duration"] = self._elapsed_ms() / 1000
         return result
 
     async def start(
@@ -140,6 +207,7 @@ class EventRecorder:
         targets: list[TargetSpec],
         include_lifecycle: bool = True,
         capture_events: bool = False,
+        max_events: int | None = None,
     ) -> dict:
         """Start recording. Subscribe to signals on targets.
 
@@ -152,39 +220,68 @@ class EventRecorder:
             capture_events: Enable global event capture (mouse, keyboard, focus).
                 When True, the probe installs a global event filter on QApplication
                 so no per-widget subscription is needed for input events.
+            max_events: Keep only the most recent this many events. None keeps
+                everything.
+
+        Raises:
+            ValueError: If max_events is less than 1. Nothing is changed.
         """
+        if max_events is not None and max_events < 1:
+            raise ValueError(f"max_events must be at least 1, got {max_events}")
+
         if self._recording:
             await self._cleanup_subscriptions(probe)
 
         self._recording = True
-        self._events = []
+        self._events = deque(maxlen=max_events)
         self._subscriptions = []
         self._include_lifecycle = include_lifecycle
         self._capture_events = capture_events
-        self._start_time = time.monotonic()
+        self._start_ns = _monotonic_ns()
 
         # Install notification handler
         probe.add_notification_handler(self._handle_notification)
 
-        # Enable lifecycle notifications if requested
+        # Setup calls and child lookups for recursive targets go out as one
+        # pipelined batch; smart-signal lookups and subscriptions follow as
+        # one batch each, so start() costs ~3 round trips regardless of size.
+        setup: list[tuple[str, dict | None]] = []
         if include_lifecycle:
-            try:
-                await probe.call("qt.signals.setLifecycle", {"enabled": True})
-            except Exception:
-                logger.debug("Failed to enable lifecycle notifications", exc_info=True)
+            setup.append(("qt.signals.setLifecycle", {"enabled": True}))
+        if capture_events:
+            setup.append(("qt.events.start", None))
+        setup.extend(
+            ("qt.objects.inspect", {"objectId": t.object_id, "parts": ["info"]})
+            for t in targets
+            if t.recursive
+        )
+        outcomes = iter(await probe.call_many(setup))
 
-        # Start global event capture if requested
+        if include_lifecycle:
+            outcome = next(outcomes)
+            if isinstance(outcome, BaseException):
+                logger.debug("Failed to enable lifecycle notifications", exc_info=outcome)
         if capture_events:
-            try:
-                await probe.call("qt.events.start")
-            except Exception:
-                logger.debug("Failed to start event capture", exc_info=True)
+            outcome = next(outcomes)
+            if isinstance(outcome, BaseException):
+                logger.debug("Failed to start event capture", exc_info=outcome)
 
-        # Subscribe to signals for each target
-        total_subs = 0
+        # (object_id, signals) for every object to watch; signals=None means
+        # smart defaults, resolved below.
+        watched: list[tuple[str, Sequence[str] | None]] = []
         for target in targets:
-            count = await self._subscribe_target(probe, target)
-            total_subs += count
+            watched.append((target.object_id, target.signals))
+            if target.recursive:
+                outcome = next(outcomes)
+                if isinstance(outcome, BaseException):
+                    logger.debug(
+                        "Failed to get children for %s", target.object_id, exc_info=outcome
+                    )
+                else:
+                    watched.extend((child, target.signals) for child in _child_ids(outcome))
+
+        watched = await self._resolve_smart_signals(probe, watched)
+        total_subs = await self._subscribe(probe, watched)
 
         return {
             "recording": True,
@@ -203,7 +300,7 @@ class EventRecorder:
                 "events": [],
             }
 
-        duration = round(time.monotonic() - self._start_time, 3)
+        duration = self._elapsed_ms() / 1000
 
         # Unsubscribe and clean up
         await self._cleanup_subscriptions(probe)
@@ -227,9 +324,12 @@ class EventRecorder:
 
         self._recording = False
 
-        events = [e.to_dict() for e in self._events]
+        recorded, self._events = self._events, deque()
+        if len(recorded) >= _OFFLOAD_MIN_EVENTS:
+            events = await asyncio.to_thread(_events_to_dicts, recorded)
+        else:
+            events = _events_to_dicts(recorded)
         event_count = len(events)
-        self._events = []
 
         return {
             "recording": False,
@@ -238,142 +338,179 @@ class EventRecorder:
             "events": events,
         }
 
-    def _handle_notification(self, method: str, params: dict) -> None:
+    def _elapsed_ms(self) -> int:
+        """Milliseconds since start(), rounded half up in integer arithmetic."""
+        return (_monotonic_ns() - self._start_ns + 500_000) // 1_000_000
+
+    def _handle_notification(
+        self, method: str, params: dict, _clock: Callable[[], int] = _monotonic_ns
+    ) -> None:
         """Synchronous handler called by ProbeConnection for each notification."""
         if not self._recording:
             return
+        record = self._recorders.get(method)
+        if record is not None:
+            # Clock read inlined from _elapsed_ms(); _clock is a fast local.
+            record(self, (_clock() - self._start_ns + 500_000) // 1_000_000, params)
+
+    def _record_signal(self, timestamp: int, params: dict) -> None:
+        """Record a qtpilot.signalEmitted notification."""
+        # Accept "arguments" or "args"; argument-less signals share the empty
+        # () default instead of each allocating an empty list.
+        arguments = params.get("arguments")
+        if arguments is None:
+            arguments = params.get("args", ())
+        self._events.append(RecordedEvent(
+            timestamp=timestamp,
+            event_type="signal",
+            object_id=params.get("objectId", ""),
+            object_name=params.get("objectName") or None,
+            detail=params.get("signal", ""),
+            arguments=arguments,
+        ))
+
+    def _record_object_created(self, timestamp: int, params: dict) -> None:
+        """Record a qtpilot.objectCreated notification."""
+        self._events.append(RecordedEvent(
+            timestamp=timestamp,
+            event_type="object_created",
+            object_id=params.get("objectId", ""),
+            object_name=params.get("objectName") or None,
+            detail=params.get("className", ""),
+        ))
+
+    def _record_input_event(self, timestamp: int, params: dict) -> None:
+        """Record a qtpilot.eventCaptured notification from the event filter."""
+        # Build detail dict with event-specific fields
+        detail: dict = {}
+        event_type = params.get("type", "")
+        if event_type.startswith("Mouse"):
+            detail["button"] = params.get("button", "")
+            pos = params.get("pos", {})
+            detail["pos"] = [pos.get("x", 0), pos.get("y", 0)]
+        elif event_type.startswith("Key"):
+            detail["key"] = params.get("key", 0)
+            detail["text"] = params.get("text", "")
+            detail["modifiers"] = params.get("modifiers", "")
+        elif event_type.startswith("Focus"):
+            detail["reason"] = params.get("reason", "")
+
+        self._events.append(RecordedInputEvent(
+            timestamp=timestamp,
+            event_type=event_type,
+            object_id=params.get("objectId", ""),
+            object_name=params.get("objectName") or None,
+            class_name=params.get("className", ""),
+            detail=detail,
+        ))
+
+    # Notification method -> recording function, looked up once per
+    # notification instead of walking an if/elif chain of string compares.
+    # qtpilot.objectDestroyed is deliberately absent: destroyed events have
+    # empty IDs (the object is already partially destructed) and generate
+    # massive noise, and the probe drops their subscriptions itself.
+    _RECORDERS: dict[str, Callable[[EventRecorder, int, dict], None]] = {
+        "qtpilot.signalEmitted": _record_signal,
+        "qtpilot.objectCreated": _record_object_created,
+        "qtpilot.eventCaptured": _record_input_event,
+    }
+    # Used while include_lifecycle is off: objectCreated is dropped at lookup.
+    _SIGNAL_RECORDERS: dict[str, Callable[[EventRecorder, int, dict], None]] = {
+        method: record
+        for method, record in _RECORDERS.items()
+        if method != "qtpilot.objectCreated"
+    }
 
-        timestamp = time.monotonic() - self._start_time
-
-        if method == "qtpilot.signalEmitted":
-            self._events.append(RecordedEvent(
-                timestamp=timestamp,
-                event_type="signal",
-                object_id=params.get("objectId", ""),
-                object_name=params.get("objectName") or None,
-                detail=params.get("signal", ""),
-                arguments=params.get("arguments", params.get("args", [])),
-            ))
-        elif method == "qtpilot.objectCreated" and self._include_lifecycle:
-            self._events.append(RecordedEvent(
-                timestamp=timestamp,
-                event_type="object_created",
-                object_id=params.get("objectId", ""),
-                object_name=params.get("objectName") or None,
-                detail=params.get("className", ""),
-            ))
-        elif method == "qtpilot.objectDestroyed" and self._include_lifecycle:
-            obj_id = params.get("objectId", "")
-            # Don't record destroyed events — they have empty IDs (object
-            # is already partially destructed) and generate massive noise.
-            # Clean up any subscriptions for the destroyed object
-            # (probe will have already unsubscribed, but we remove from our list)
-        elif method == "qtpilot.eventCaptured":
-            # Build detail dict with event-specific fields
-            detail: dict = {}
-            event_type = params.get("type", "")
-            if event_type.startswith("Mouse"):
-                detail["button"] = params.get("button", "")
-                pos = params.get("pos", {})
-                detail["pos"] = [pos.get("x", 0), pos.get("y", 0)]
-            elif event_type.startswith("Key"):
-                detail["key"] = params.get("key", 0)
-                detail["text"] = params.get("text", "")
-                detail["modifiers"] = params.get("modifiers", "")
-            elif event_type.startswith("Focus"):
-                detail["reason"] = params.get("reason", "")
-
-            self._events.append(RecordedInputEvent(
-                timestamp=timestamp,
-                event_type=event_type,
-                object_id=params.get("objectId", ""),
-                object_name=params.get("objectName") or None,
-                class_name=params.get("className", ""),
-                detail=detail,
-            ))
-
-    async def _subscribe_target(
-        self, probe: ProbeConnection, target: TargetSpec
+    async def _resolve_smart_signals(
+        self, probe: ProbeConnection, watched: list[tuple[str, Sequence[str] | None]]
+    ) -> list[tuple[str, Sequence[str]]]:
+        """Fill in default signals, based on each object's class, where signals is None."""
+        unresolved = [obj_id for obj_id, signals in watched if signals is None]
+        if not unresolved:
+            return watched
+        infos = await probe.call_many([
+            ("qt.objects.inspect", {"objectId": obj_id, "parts": ["info"]})
+            for obj_id in unresolved
+        ])
+        defaults = iter(_default_signals(info) for info in infos)
+        return [
+            (obj_id, signals if signals is not None else next(defaults))
+            for obj_id, signals in watched
+        ]
+
+    async def _subscribe(
+        self, probe: ProbeConnection, watched: list[tuple[str, Sequence[str]]]
     ) -> int:
-        """Subscribe to signals on a single target. Returns subscription count."""
-        objects_to_subscribe = [target.object_id]
+        """Subscribe to every (object, signal) pair. Returns subscription count."""
+        pairs = [(obj_id, signal) for obj_id, signals in watched for signal in signals]
+        results = await probe.call_many([
+            ("qt.signals.subscribe", {"objectId": obj_id, "signal": signal})
+            for obj_id, signal in pairs
+        ])
 
-        if target.recursive:
-            try:
-                resp = await probe.call(
-                    "qt.objects.inspect",
-                    {"objectId": target.object_id, "parts": ["info"]},
-                )
-                # Probe wraps: {"meta":{...}, "result": {"info": {"children":[...]}}}
-                body = resp.get("result", resp)
-                info = body.get("info", body)
-                children = info.get("children", [])
-                objects_to_subscribe.extend(
-                    c.get("objectId", c) if isinstance(c, dict) else c
-                    for c in children
-                )
-            except Exception:
+        count = 0
+        for (obj_id, signal), result in zip(pairs, results):
+            if isinstance(result, BaseException):
                 logger.debug(
-                    "Failed to get children for %s", target.object_id, exc_info=True
+                    "Failed to subscribe %s.%s", obj_id, signal, exc_info=result
                 )
-
-        count = 0
-        for obj_id in objects_to_subscribe:
-            signals = target.signals
-            if signals is None:
-                signals = await self._resolve_smart_signals(probe, obj_id)
-
-            for signal in signals:
-                try:
-                    result = await probe.call(
-                        "qt.signals.subscribe",
-                        {"objectId": obj_id, "signal": signal},
-                    )
-                    # Probe wraps result: {"meta":{...}, "result": {"subscriptionId":...}}
-                    inner = result.get("result", result)
-                    sub_id = inner.get("subscriptionId")
-                    if sub_id:
-                        self._subscriptions.append(sub_id)
-                        count += 1
-                except Exception:
-                    logger.debug(
-                        "Failed to subscribe %s.%s", obj_id, signal, exc_info=True
-                    )
+                continue
+            # Probe wraps result: {"meta":{...}, "result": {"subscriptionId":...}}
+            inner = result.get("result", result)
+            sub_id = inner.get("subscriptionId")
+            if sub_id:
+                self._subscriptions.append(sub_id)
+                count += 1
 
         return count
 
-    async def _resolve_smart_signals(
-        self, probe: ProbeConnection, object_id: str
-    ) -> list[str]:
-        """Determine default signals for an object based on its class."""
-        try:
-            resp = await probe.call(
-                "qt.objects.inspect", {"objectId": object_id, "parts": ["info"]}
-            )
-            # Probe wraps: {"meta":{...}, "result": {"info": {"className":...}}}
-            body = resp.get("result", resp)
-            info = body.get("info", body)
-            class_name = info.get("className", "")
-        except Exception:
-            return FALLBACK_SIGNALS
-
-        if class_name in INTERACTIVE_SIGNALS:
-            return INTERACTIVE_SIGNALS[class_name]
-
-        # Check superclasses by trying common base patterns
-        for known_class, signals in INTERACTIVE_SIGNALS.items():
-            if class_name.endswith(known_class) or known_class.endswith(class_name):
-                return signals
-
-        return FALLBACK_SIGNALS
-
     async def _cleanup_subscriptions(self, probe: ProbeConnection) -> None:
         """Unsubscribe all tracked subscriptions."""
-        for sub_id in self._subscriptions:
-            try:
-                await probe.call(
-                    "qt.signals.unsubscribe", {"subscriptionId": sub_id}
-                )
-            except Exception:
-                logger.debug("Failed to unsubscribe %s", sub_id, exc_info=True)
+        results = await probe.call_many([
+            ("qt.signals.unsubscribe", {"subscriptionId": sub_id})
+            for sub_id in self._subscriptions
+        ])
+        for sub_id, result in zip(self._subscriptions, results):
+            if isinstance(result, BaseException):
+                logger.debug("Failed to unsubscribe %s", sub_id, exc_info=result)
         self._subscriptions = []
+
+
+def _info(resp: dict) -> dict:
+    """Unwrap the info section of a qt.objects.inspect response."""
+    # Probe wraps: {"meta":{...}, "result": {"info": {...}}}
+    body = resp.get("result", resp)
+    return body.get("info", body)
+
+
+def _child_ids(resp: dict) -> list[str]:
+    """Child object IDs from a qt.objects.inspect response."""
+    return [
+        c.get("objectId", c) if isinstance(c, dict) else c
+        for c in _info(resp).get("children", [])
+    ]
+
+
+def _default_signals(resp: dict | BaseException) -> tuple[str, ...]:
+    """Pick default signals from a qt.objects.inspect response (or failure)."""
+    if isinstance(resp, BaseException):
+        return FALLBACK_SIGNALS
+    return _signals_for_class(_info(resp).get("className", ""))
+
+
+@functools.cache
+def _signals_for_class(class_name: str) -> tuple[str, ...]:
+    """Default signals for a Qt class name.
+
+    Cached per class: a recording usually watches many widgets of a few
+    classes, and unknown classes otherwise rescan the whole table.
+    """
+    if class_name in INTERACTIVE_SIGNALS:
+        return INTERACTIVE_SIGNALS[class_name]
+
+    # Check superclasses by trying common base patterns
+    for known_class, signals in INTERACTIVE_SIGNALS.items():
+        if class_name.endswith(known_class) or known_class.endswith(class_name):
+            return signals
+
+    return FALLBACK_SIGNALS
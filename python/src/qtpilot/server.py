@@ -5,25 +5,28 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import shutil
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import AsyncIterator, Sequence
 
 from fastmcp import FastMCP
 
 from qtpilot.connection import ProbeConnection, ProbeError
 from qtpilot.discovery import DiscoveryListener
+from qtpilot.download import get_launcher_filename
 from qtpilot.event_recorder import EventRecorder
 from qtpilot.message_logger import MessageLogger
+from qtpilot.qt_env import build_subprocess_env
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Prefix mapping: mode -> tool name prefixes
 # ---------------------------------------------------------------------------
-_MODE_PREFIXES: dict[str, list[str]] = {
-    "native": ["qt_"],
-    "cu": ["cu_"],
-    "chrome": ["chr_"],
+_MODE_PREFIXES: dict[str, tuple[str, ...]] = {
+    "native": ("qt_",),
+    "cu": ("cu_",),
+    "chrome": ("chr_",),
 }
 
 
@@ -111,6 +114,14 @@ def get_mode() -> str:
     return _state.mode if _state else "native"
 
 
+def get_snapshot() -> tuple[ProbeConnection | None, DiscoveryListener | None, str]:
+    """Get (probe, discovery, mode) in one read of the server state."""
+    state = _state
+    if state is None:
+        return None, None, "native"
+    return state.probe, state.discovery, state.mode
+
+
 def get_recorder() -> EventRecorder:
     """Get the shared EventRecorder instance."""
     if _state is None:
@@ -163,23 +174,44 @@ async def disconnect_probe() -> None:
         state.probe = None
 
 
+def _resolve_launcher(launcher: str) -> str | None:
+    """Resolve the launcher to an executable path, or None if it does not exist.
+
+    Bare names are looked up on PATH, like the subprocess exec would do;
+    anything with a directory component must be an existing file.
+    """
+    if os.path.dirname(launcher):
+        return launcher if os.path.isfile(launcher) else None
+    return shutil.which(launcher)
+
+
+_INSTALL_HINT = "Install with: qtpilot download-tools --qt-version <VERSION>"
+
+
+def _launcher_not_found(launcher: str) -> FileNotFoundError:
+    """Build the error raised when the launcher executable is missing."""
+    return FileNotFoundError(f"Launcher not found: {launcher!r}. {_INSTALL_HINT}")
+
+
 # ---------------------------------------------------------------------------
 # Tool registration helpers
 # ---------------------------------------------------------------------------
 
-def _has_tools_with_prefix(mcp: FastMCP, prefixes: list[str]) -> bool:
+def _has_tools_with_prefix(mcp: FastMCP, prefixes: Sequence[str]) -> bool:
     """Check if any tools with the given prefixes are already registered."""
-    for name in mcp._tool_manager._tools:
-        if any(name.startswith(p) for p in prefixes):
-            return True
-    return False
+    if not prefixes:
+        return False
+    prefixes = tuple(prefixes)
+    return any(name.startswith(prefixes) for name in mcp._tool_manager._tools)
 
 
-def _remove_tools_by_prefixes(mcp: FastMCP, prefixes: list[str]) -> None:
+def _remove_tools_by_prefixes(mcp: FastMCP, prefixes: Sequence[str]) -> None:
     """Remove all tools whose names match any of the given prefixes."""
+    if not prefixes:
+        return
+    prefixes = tuple(prefixes)
     to_remove = [
-        name for name in list(mcp._tool_manager._tools)
-        if any(name.startswith(p) for p in prefixes)
+        name for name in mcp._tool_manager._tools if name.startswith(prefixes)
     ]
     for name in to_remove:
         mcp.remove_tool(name)
@@ -187,7 +219,7 @@ def _remove_tools_by_prefixes(mcp: FastMCP, prefixes: list[str]) -> None:
 
 def _register_mode_tools_if_absent(mcp: FastMCP, mode: str) -> None:
     """Register tools for a mode, skipping if tools with that prefix already exist."""
-    prefixes = _MODE_PREFIXES.get(mode, [])
+    prefixes = _MODE_PREFIXES.get(mode, ())
     if _has_tools_with_prefix(mcp, prefixes):
         return
     if mode == "native":
@@ -261,9 +293,6 @@ def create_server(
             # Auto-launch target if specified
             actual_ws_url = ws_url
             if target is not None:
-                from qtpilot.download import get_launcher_filename
-                from qtpilot.qt_env import build_subprocess_env
-
                 launcher = (
                     launcher_path
                     or os.environ.get("QTPILOT_LAUNCHER")
@@ -273,6 +302,11 @@ def create_server(
                     "Launching target %s via %s on port %d", target, launcher, port
                 )
 
+                # Fail fast without spawning a process if the launcher is missing
+                resolved = _resolve_launcher(launcher)
+                if resolved is None:
+                    raise _launcher_not_found(launcher)
+
                 # Build environment with Qt paths detected/configured
                 env = build_subprocess_env(
                     target_path=target,
@@ -280,7 +314,7 @@ def create_server(
                 )
 
                 launch_args = [
-                    launcher,
+                    resolved,
                     target,
                     "--port",
                     str(port),
@@ -297,14 +331,10 @@ def create_server(
                         env=env,
                     )
                 except FileNotFoundError:
-                    raise FileNotFoundError(
-                        f"Launcher not found: {launcher!r}. "
-                        "Install with: qtpilot download-tools --qt-version <VERSION>"
-                    )
+                    raise _launcher_not_found(launcher)
                 except OSError as e:
                     raise OSError(
-                        f"Could not start launcher {launcher!r}: {e}. "
-                        "Install with: qtpilot download-tools --qt-version <VERSION>"
+                        f"Could not start launcher {launcher!r}: {e}. {_INSTALL_HINT}"
                     ) from e
                 await asyncio.sleep(1.5)
                 actual_ws_url = f"ws://localhost:{port}"
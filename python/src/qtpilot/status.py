@@ -16,16 +16,15 @@ def register_status_resource(mcp: FastMCP) -> None:
     @mcp.resource("qtpilot://status")
     def probe_status() -> str:
         """Current probe connection status."""
-        from qtpilot.server import get_discovery, get_mode, get_probe
+        from qtpilot.server import get_snapshot
 
-        probe = get_probe()
-        discovery = get_discovery()
+        probe, discovery, mode = get_snapshot()
 
         connected = probe is not None and probe.is_connected
         result = {
             "connected": connected,
             "ws_url": probe.ws_url if connected else None,
-            "mode": get_mode(),
+            "mode": mode,
             "discovery_active": discovery is not None and discovery.is_running,
             "discovered_probes": len(discovery.probes) if discovery else 0,
         }
@@ -0,0 +1,84 @@
+"""Table-driven registration for tools that forward straight to one probe method.
+
+Most mode tools take a handful of arguments, drop the ones left as None, and
+pass the rest to a single JSON-RPC method. Instead of one hand-written
+closure per tool, each tool is described by a ToolSpec and registered from a
+single coroutine template whose signature is patched so FastMCP still sees
+the declared, typed parameters.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from fastmcp import FastMCP
+
+from qtpilot.server import require_probe
+
+REQUIRED = inspect.Parameter.empty
+
+
+@dataclass(frozen=True)
+class Arg:
+    """A tool parameter forwarded as a JSON-RPC param."""
+
+    name: str
+    annotation: Any
+    default: Any = REQUIRED
+    key: str | None = None  # JSON-RPC param name, if different from `name`
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A tool that forwards its arguments to a single probe method."""
+
+    name: str
+    method: str
+    doc: str
+    args: tuple[Arg, ...] = ()
+
+
+def make_forwarder(spec: ToolSpec) -> Callable[..., Awaitable[dict]]:
+    """Build the coroutine function for a ToolSpec.
+
+    Arguments that are None are omitted from the request; arguments with a
+    non-None default are always sent.
+    """
+    method = spec.method
+    keys = {a.name: a.key or a.name for a in spec.args}
+    defaults = {
+        a.name: a.default
+        for a in spec.args
+        if a.default is not REQUIRED and a.default is not None
+    }
+
+    async def tool(**kwargs: Any) -> dict:
+        if defaults:
+            kwargs = {**defaults, **kwargs}
+        params = {keys[k]: v for k, v in kwargs.items() if v is not None}
+        return await require_probe().call(method, params)
+
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = spec.doc
+    tool.__signature__ = inspect.Signature(
+        [
+            inspect.Parameter(
+                a.name, inspect.Parameter.KEYWORD_ONLY,
+                default=a.default, annotation=a.annotation,
+            )
+            for a in spec.args
+        ],
+        return_annotation=dict,
+    )
+    tool.__annotations__ = {a.name: a.annotation for a in spec.args}
+    tool.__annotations__["return"] = dict
+    return tool
+
+
+def register_forwarders(mcp: FastMCP, specs: Iterable[ToolSpec]) -> None:
+    """Register one forwarding tool per spec on the MCP server."""
+    for spec in specs:
+        mcp.tool(make_forwarder(spec))
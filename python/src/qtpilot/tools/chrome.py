@@ -2,106 +2,69 @@
 
 from __future__ import annotations
 
-from fastmcp import Context, FastMCP
+from fastmcp import FastMCP
 
+from qtpilot.tools._forward import Arg, ToolSpec, register_forwarders
 
-def register_chrome_tools(mcp: FastMCP) -> None:
-    """Register all chrome mode tools on the MCP server."""
-
-    @mcp.tool
-    async def chr_readPage(
-        filter: str | None = None,
-        maxDepth: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+CHROME_TOOLS: tuple[ToolSpec, ...] = (
+    ToolSpec(
+        "chr_readPage", "chr.readPage",
         """Read the accessible page structure with optional filtering.
-        Example: chr_readPage(filter="buttons")
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {}
-        if filter is not None:
-            params["filter"] = filter
-        if maxDepth is not None:
-            params["maxDepth"] = maxDepth
-        return await require_probe().call("chr.readPage", params)
-
-    @mcp.tool
-    async def chr_click(ref: str, ctx: Context = None) -> dict:
+Example: chr_readPage(filter="buttons")""",
+        (Arg("filter", str | None, None), Arg("maxDepth", int | None, None)),
+    ),
+    ToolSpec(
+        "chr_click", "chr.click",
         """Click an element by its accessibility reference.
-        Example: chr_click(ref="btn_submit")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.click", {"ref": ref})
-
-    @mcp.tool
-    async def chr_formInput(ref: str, value: str | int | float | bool, ctx: Context = None) -> dict:
+Example: chr_click(ref="btn_submit")""",
+        (Arg("ref", str),),
+    ),
+    ToolSpec(
+        "chr_formInput", "chr.formInput",
         """Set a form input value by accessibility reference.
-        Example: chr_formInput(ref="input_name", value="Alice")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.formInput", {"ref": ref, "value": value})
-
-    @mcp.tool
-    async def chr_getPageText(ctx: Context) -> dict:
+Example: chr_formInput(ref="input_name", value="Alice")""",
+        (Arg("ref", str), Arg("value", str | int | float | bool)),
+    ),
+    ToolSpec(
+        "chr_getPageText", "chr.getPageText",
         """Get all visible text content from the page.
-        Example: chr_getPageText()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.getPageText")
-
-    @mcp.tool
-    async def chr_find(query: str, ctx: Context = None) -> dict:
+Example: chr_getPageText()""",
+    ),
+    ToolSpec(
+        "chr_find", "chr.find",
         """Search for elements matching a text query.
-        Example: chr_find(query="Submit")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.find", {"query": query})
-
-    @mcp.tool
-    async def chr_navigate(ref: str, action: str = "activateTab", ctx: Context = None) -> dict:
+Example: chr_find(query="Submit")""",
+        (Arg("query", str),),
+    ),
+    ToolSpec(
+        "chr_navigate", "chr.navigate",
         """Navigate to or activate an element by reference.
 
-        Args:
-            ref: Element reference from chr_readPage/chr_find.
-            action: One of "activateTab", "activateMenuItem", "back", "forward".
-
-        Example: chr_navigate(ref="ref_65", action="activateTab")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.navigate", {"ref": ref, "action": action})
+Args:
+    ref: Element reference from chr_readPage/chr_find.
+    action: One of "activateTab", "activateMenuItem", "back", "forward".
 
-    @mcp.tool
-    async def chr_tabsContext(ctx: Context) -> dict:
+Example: chr_navigate(ref="ref_65", action="activateTab")""",
+        (Arg("ref", str), Arg("action", str, "activateTab")),
+    ),
+    ToolSpec(
+        "chr_tabsContext", "chr.tabsContext",
         """Get context about all tabs/windows in the application.
-        Example: chr_tabsContext()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("chr.tabsContext")
-
-    @mcp.tool
-    async def chr_readConsoleMessages(
-        limit: int | None = None,
-        pattern: str | None = None,
-        clear: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: chr_tabsContext()""",
+    ),
+    ToolSpec(
+        "chr_readConsoleMessages", "chr.readConsoleMessages",
         """Read console/debug messages with optional filtering.
-        Example: chr_readConsoleMessages(limit=10, pattern="error")
-        """
-        from qtpilot.server import require_probe
+Example: chr_readConsoleMessages(limit=10, pattern="error")""",
+        (
+            Arg("limit", int | None, None),
+            Arg("pattern", str | None, None),
+            Arg("clear", bool | None, None),
+        ),
+    ),
+)
+
 
-        params: dict = {}
-        if limit is not None:
-            params["limit"] = limit
-        if pattern is not None:
-            params["pattern"] = pattern
-        if clear is not None:
-            params["clear"] = clear
-        return await require_probe().call("chr.readConsoleMessages", params)
+def register_chrome_tools(mcp: FastMCP) -> None:
+    """Register all chrome mode tools on the MCP server."""
+    register_forwarders(mcp, CHROME_TOOLS)
@@ -2,209 +2,99 @@
 
 from __future__ import annotations
 
-from fastmcp import Context, FastMCP
+from fastmcp import FastMCP
 
+from qtpilot.tools._forward import Arg, ToolSpec, register_forwarders
 
-def register_cu_tools(mcp: FastMCP) -> None:
-    """Register all computer use mode tools on the MCP server."""
+_XY = (Arg("x", int), Arg("y", int))
+_SCREEN_ABSOLUTE = Arg("screenAbsolute", bool | None, None)
+_CLICK_ARGS = (*_XY, _SCREEN_ABSOLUTE, Arg("delay_ms", int | None, None))
+_BUTTON_ARGS = (*_XY, Arg("button", str | None, None), _SCREEN_ABSOLUTE)
 
-    @mcp.tool
-    async def cu_screenshot(ctx: Context) -> dict:
+CU_TOOLS: tuple[ToolSpec, ...] = (
+    ToolSpec(
+        "cu_screenshot", "cu.screenshot",
         """Capture a full screenshot of the application window.
-        Example: cu_screenshot()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("cu.screenshot")
-
-    @mcp.tool
-    async def cu_leftClick(
-        x: int, y: int,
-        screenAbsolute: bool | None = None,
-        delay_ms: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_screenshot()""",
+    ),
+    ToolSpec(
+        "cu_leftClick", "cu.click",
         """Left-click at the given coordinates.
-        Example: cu_leftClick(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        if delay_ms is not None:
-            params["delay_ms"] = delay_ms
-        return await require_probe().call("cu.click", params)
-
-    @mcp.tool
-    async def cu_rightClick(
-        x: int, y: int,
-        screenAbsolute: bool | None = None,
-        delay_ms: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_leftClick(x=100, y=200)""",
+        _CLICK_ARGS,
+    ),
+    ToolSpec(
+        "cu_rightClick", "cu.rightClick",
         """Right-click at the given coordinates.
-        Example: cu_rightClick(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        if delay_ms is not None:
-            params["delay_ms"] = delay_ms
-        return await require_probe().call("cu.rightClick", params)
-
-    @mcp.tool
-    async def cu_middleClick(
-        x: int, y: int,
-        screenAbsolute: bool | None = None,
-        delay_ms: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_rightClick(x=100, y=200)""",
+        _CLICK_ARGS,
+    ),
+    ToolSpec(
+        "cu_middleClick", "cu.middleClick",
         """Middle-click at the given coordinates.
-        Example: cu_middleClick(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        if delay_ms is not None:
-            params["delay_ms"] = delay_ms
-        return await require_probe().call("cu.middleClick", params)
-
-    @mcp.tool
-    async def cu_doubleClick(
-        x: int, y: int,
-        screenAbsolute: bool | None = None,
-        delay_ms: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_middleClick(x=100, y=200)""",
+        _CLICK_ARGS,
+    ),
+    ToolSpec(
+        "cu_doubleClick", "cu.doubleClick",
         """Double-click at the given coordinates.
-        Example: cu_doubleClick(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        if delay_ms is not None:
-            params["delay_ms"] = delay_ms
-        return await require_probe().call("cu.doubleClick", params)
-
-    @mcp.tool
-    async def cu_mouseMove(
-        x: int, y: int,
-        screenAbsolute: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_doubleClick(x=100, y=200)""",
+        _CLICK_ARGS,
+    ),
+    ToolSpec(
+        "cu_mouseMove", "cu.mouseMove",
         """Move the mouse cursor to the given coordinates.
-        Example: cu_mouseMove(x=300, y=400)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        return await require_probe().call("cu.mouseMove", params)
-
-    @mcp.tool
-    async def cu_mouseDrag(
-        startX: int, startY: int, endX: int, endY: int,
-        screenAbsolute: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_mouseMove(x=300, y=400)""",
+        (*_XY, _SCREEN_ABSOLUTE),
+    ),
+    ToolSpec(
+        "cu_mouseDrag", "cu.mouseDrag",
         """Drag from start to end coordinates.
-        Example: cu_mouseDrag(startX=10, startY=20, endX=200, endY=300)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"startX": startX, "startY": startY, "endX": endX, "endY": endY}
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        return await require_probe().call("cu.mouseDrag", params)
-
-    @mcp.tool
-    async def cu_mouseDown(
-        x: int, y: int,
-        button: str | None = None,
-        screenAbsolute: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_mouseDrag(startX=10, startY=20, endX=200, endY=300)""",
+        (
+            Arg("startX", int), Arg("startY", int),
+            Arg("endX", int), Arg("endY", int),
+            _SCREEN_ABSOLUTE,
+        ),
+    ),
+    ToolSpec(
+        "cu_mouseDown", "cu.mouseDown",
         """Press a mouse button down at the given coordinates.
-        Example: cu_mouseDown(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if button is not None:
-            params["button"] = button
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        return await require_probe().call("cu.mouseDown", params)
-
-    @mcp.tool
-    async def cu_mouseUp(
-        x: int, y: int,
-        button: str | None = None,
-        screenAbsolute: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_mouseDown(x=100, y=200)""",
+        _BUTTON_ARGS,
+    ),
+    ToolSpec(
+        "cu_mouseUp", "cu.mouseUp",
         """Release a mouse button at the given coordinates.
-        Example: cu_mouseUp(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y}
-        if button is not None:
-            params["button"] = button
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        return await require_probe().call("cu.mouseUp", params)
-
-    @mcp.tool
-    async def cu_type(text: str, ctx: Context = None) -> dict:
+Example: cu_mouseUp(x=100, y=200)""",
+        _BUTTON_ARGS,
+    ),
+    ToolSpec(
+        "cu_type", "cu.type",
         """Type text at the current cursor position.
-        Example: cu_type(text="Hello world")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("cu.type", {"text": text})
-
-    @mcp.tool
-    async def cu_key(key: str, ctx: Context = None) -> dict:
+Example: cu_type(text="Hello world")""",
+        (Arg("text", str),),
+    ),
+    ToolSpec(
+        "cu_key", "cu.key",
         """Press a key or key combination.
-        Example: cu_key(key="Return")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("cu.key", {"key": key})
-
-    @mcp.tool
-    async def cu_scroll(
-        x: int, y: int, direction: str,
-        amount: int | None = None,
-        screenAbsolute: bool | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: cu_key(key="Return")""",
+        (Arg("key", str),),
+    ),
+    ToolSpec(
+        "cu_scroll", "cu.scroll",
         """Scroll at the given coordinates in a direction.
-        Example: cu_scroll(x=100, y=200, direction="down", amount=3)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"x": x, "y": y, "direction": direction}
-        if amount is not None:
-            params["amount"] = amount
-        if screenAbsolute is not None:
-            params["screenAbsolute"] = screenAbsolute
-        return await require_probe().call("cu.scroll", params)
-
-    @mcp.tool
-    async def cu_cursorPosition(ctx: Context) -> dict:
+Example: cu_scroll(x=100, y=200, direction="down", amount=3)""",
+        (*_XY, Arg("direction", str), Arg("amount", int | None, None), _SCREEN_ABSOLUTE),
+    ),
+    ToolSpec(
+        "cu_cursorPosition", "cu.cursorPosition",
         """Get the current cursor position.
-        Example: cu_cursorPosition()
-        """
-        from qtpilot.server import require_probe
+Example: cu_cursorPosition()""",
+    ),
+)
 
-        return await require_probe().call("cu.cursorPosition")
+
+def register_cu_tools(mcp: FastMCP) -> None:
+    """Register all computer use mode tools on the MCP server."""
+    register_forwarders(mcp, CU_TOOLS)
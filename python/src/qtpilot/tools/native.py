@@ -2,419 +2,290 @@
 
 from __future__ import annotations
 
-from fastmcp import Context, FastMCP
+from fastmcp import FastMCP
 
+from qtpilot.connection import ProbeError
+from qtpilot.server import require_probe
+from qtpilot.tools._forward import Arg, ToolSpec, register_forwarders
 
-def register_native_tools(mcp: FastMCP) -> None:
-    """Register all native mode tools on the MCP server."""
+_OBJECT_ID = Arg("objectId", str)
 
+NATIVE_TOOLS: tuple[ToolSpec, ...] = (
     # -- Utility / discovery ------------------------------------------------
-
-    @mcp.tool
-    async def qt_ping(ctx: Context) -> dict:
+    ToolSpec(
+        "qt_ping", "qt.ping",
         """Ping the probe to check connectivity.
-        Example: qt_ping()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.ping")
-
-    @mcp.tool
-    async def qt_version(ctx: Context) -> dict:
+Example: qt_ping()""",
+    ),
+    ToolSpec(
+        "qt_version", "qt.version",
         """Return Qt and probe version information.
-        Example: qt_version()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.version")
-
+Example: qt_version()""",
+    ),
     # -- Object tree --------------------------------------------------------
-
-    @mcp.tool
-    async def qt_objects_tree(root: str | None = None, maxDepth: int | None = None, ctx: Context = None) -> dict:
+    ToolSpec(
+        "qt_objects_tree", "qt.objects.tree",
         """Get the object tree, optionally from a root with limited depth.
-        Example: qt_objects_tree(maxDepth=3)
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {}
-        if root is not None:
-            params["root"] = root
-        if maxDepth is not None:
-            params["maxDepth"] = maxDepth
-        return await require_probe().call("qt.objects.tree", params)
-
-    @mcp.tool
-    async def qt_objects_inspect(
-        objectId: str,
-        parts: str | list[str] | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: qt_objects_tree(maxDepth=3)""",
+        (Arg("root", str | None, None), Arg("maxDepth", int | None, None)),
+    ),
+    ToolSpec(
+        "qt_objects_inspect", "qt.objects.inspect",
         """Inspect an object with selectable detail sections.
 
-        `parts` controls which sections are returned. Default is `["info"]` for a
-        lightweight overview. Use `"all"` or a list like `["info","properties","methods"]`
-        for more detail.
+`parts` controls which sections are returned. Default is `["info"]` for a
+lightweight overview. Use `"all"` or a list like `["info","properties","methods"]`
+for more detail.
 
-        Valid parts: info, properties, methods, signals, qml, geometry, model.
-        Parts that don't apply to the object (e.g. `model` on a non-model object) return
-        as a null value rather than raising.
+Valid parts: info, properties, methods, signals, qml, geometry, model.
+Parts that don't apply to the object (e.g. `model` on a non-model object) return
+as a null value rather than raising.
 
-        Args:
-            objectId: The object to inspect
-            parts: Sections to include. String "all" includes everything; string "info"
-                   (or omitted) returns just info. A list names specific sections.
+Args:
+    objectId: The object to inspect
+    parts: Sections to include. String "all" includes everything; string "info"
+           (or omitted) returns just info. A list names specific sections.
 
-        Example: qt_objects_inspect(objectId="MainWindow", parts=["info","geometry"])
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"objectId": objectId}
-        if parts is not None:
-            params["parts"] = parts
-        return await require_probe().call("qt.objects.inspect", params)
-
-    @mcp.tool
-    async def qt_objects_search(
-        objectName: str | None = None,
-        className: str | None = None,
-        properties: dict | None = None,
-        root: str | None = None,
-        limit: int | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: qt_objects_inspect(objectId="MainWindow", parts=["info","geometry"])""",
+        (_OBJECT_ID, Arg("parts", str | list[str] | None, None)),
+    ),
+    ToolSpec(
+        "qt_objects_search", "qt.objects.search",
         """Discover objects by name, class, and/or property filters.
 
-        At least one of `objectName`, `className`, or `properties` must be provided.
-        Returns a uniform envelope with `objects`, `count`, `truncated`.
-
-        To discover which property names are available for filtering, call
-        qt_objects_inspect(objectId=X, parts=["properties"]) on a sample instance.
-
-        Args:
-            objectName: Exact match on QObject::objectName()
-            className: Exact match (subclass-aware) on metaObject()->className()
-            properties: Property-value filters; every listed property must equal the given value
-            root: Restrict search to this subtree
-            limit: Maximum matches returned (default 50)
-
-        Example: qt_objects_search(className="QPushButton", properties={"enabled": True})
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {}
-        if objectName is not None:
-            params["objectName"] = objectName
-        if className is not None:
-            params["className"] = className
-        if properties is not None:
-            params["properties"] = properties
-        if root is not None:
-            params["root"] = root
-        if limit is not None:
-            params["limit"] = limit
-        return await require_probe().call("qt.objects.search", params)
-
+At least one of `objectName`, `className`, or `properties` must be provided.
+Returns a uniform envelope with `objects`, `count`, `truncated`.
+
+To discover which property names are available for filtering, call
+qt_objects_inspect(objectId=X, parts=["properties"]) on a sample instance.
+
+Args:
+    objectName: Exact match on QObject::objectName()
+    className: Exact match (subclass-aware) on metaObject()->className()
+    properties: Property-value filters; every listed property must equal the given value
+    root: Restrict search to this subtree
+    limit: Maximum matches returned (default 50)
+
+Example: qt_objects_search(className="QPushButton", properties={"enabled": True})""",
+        (
+            Arg("objectName", str | None, None),
+            Arg("className", str | None, None),
+            Arg("properties", dict | None, None),
+            Arg("root", str | None, None),
+            Arg("limit", int | None, None),
+        ),
+    ),
     # -- Properties ---------------------------------------------------------
-
-    @mcp.tool
-    async def qt_properties_get(objectId: str, name: str, ctx: Context = None) -> dict:
+    ToolSpec(
+        "qt_properties_get", "qt.properties.get",
         """Get a single property value.
-        Example: qt_properties_get(objectId="MainWindow", name="windowTitle")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.properties.get", {"objectId": objectId, "name": name})
-
-    @mcp.tool
-    async def qt_properties_set(
-        objectId: str, name: str, value: str | int | float | bool, ctx: Context = None
-    ) -> dict:
+Example: qt_properties_get(objectId="MainWindow", name="windowTitle")""",
+        (_OBJECT_ID, Arg("name", str)),
+    ),
+    ToolSpec(
+        "qt_properties_set", "qt.properties.set",
         """Set a property value on an object.
-        Example: qt_properties_set(objectId="lineEdit", name="text", value="hello")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call(
-            "qt.properties.set", {"objectId": objectId, "name": name, "value": value}
-        )
-
+Example: qt_properties_set(objectId="lineEdit", name="text", value="hello")""",
+        (_OBJECT_ID, Arg("name", str), Arg("value", str | int | float | bool)),
+    ),
     # -- Methods ------------------------------------------------------------
-
-    @mcp.tool
-    async def qt_methods_invoke(
-        objectId: str, method: str, args: list | None = None, ctx: Context = None
-    ) -> dict:
+    ToolSpec(
+        "qt_methods_invoke", "qt.methods.invoke",
         """Invoke a method on an object with optional arguments.
-        Example: qt_methods_invoke(objectId="MainWindow", method="close")
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"objectId": objectId, "method": method}
-        if args is not None:
-            params["args"] = args
-        return await require_probe().call("qt.methods.invoke", params)
-
+Example: qt_methods_invoke(objectId="MainWindow", method="close")""",
+        (_OBJECT_ID, Arg("method", str), Arg("args", list | None, None)),
+    ),
     # -- Signals ------------------------------------------------------------
-
-    @mcp.tool
-    async def qt_signals_subscribe(objectId: str, signal: str, ctx: Context = None) -> dict:
+    ToolSpec(
+        "qt_signals_subscribe", "qt.signals.subscribe",
         """Subscribe to a signal on an object.
-        Example: qt_signals_subscribe(objectId="button", signal="clicked")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call(
-            "qt.signals.subscribe", {"objectId": objectId, "signal": signal}
-        )
-
-    @mcp.tool
-    async def qt_signals_unsubscribe(subscriptionId: str, ctx: Context = None) -> dict:
+Example: qt_signals_subscribe(objectId="button", signal="clicked")""",
+        (_OBJECT_ID, Arg("signal", str)),
+    ),
+    ToolSpec(
+        "qt_signals_unsubscribe", "qt.signals.unsubscribe",
         """Unsubscribe from a signal by subscription ID.
-        Example: qt_signals_unsubscribe(subscriptionId="sub_1")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call(
-            "qt.signals.unsubscribe", {"subscriptionId": subscriptionId}
-        )
-
-    @mcp.tool
-    async def qt_signals_setLifecycle(enabled: bool, ctx: Context = None) -> dict:
+Example: qt_signals_unsubscribe(subscriptionId="sub_1")""",
+        (Arg("subscriptionId", str),),
+    ),
+    ToolSpec(
+        "qt_signals_setLifecycle", "qt.signals.setLifecycle",
         """Enable or disable lifecycle signal notifications.
-        Example: qt_signals_setLifecycle(enabled=True)
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.signals.setLifecycle", {"enabled": enabled})
-
+Example: qt_signals_setLifecycle(enabled=True)""",
+        (Arg("enabled", bool),),
+    ),
     # -- Event capture ------------------------------------------------------
-
-    @mcp.tool
-    async def qt_events_start(ctx: Context) -> dict:
+    ToolSpec(
+        "qt_events_start", "qt.events.start",
         """Start global event capture on the Qt application.
 
-        Installs a global event filter that captures user-interaction events
-        (mouse clicks, key presses, focus changes) for every widget without
-        needing per-widget signal subscriptions.
+Installs a global event filter that captures user-interaction events
+(mouse clicks, key presses, focus changes) for every widget without
+needing per-widget signal subscriptions.
 
-        Example: qt_events_start()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.events.start")
-
-    @mcp.tool
-    async def qt_events_stop(ctx: Context) -> dict:
+Example: qt_events_start()""",
+    ),
+    ToolSpec(
+        "qt_events_stop", "qt.events.stop",
         """Stop global event capture.
 
-        Removes the global event filter installed by qt_events_start.
-
-        Example: qt_events_stop()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.events.stop")
+Removes the global event filter installed by qt_events_start.
 
+Example: qt_events_stop()""",
+    ),
     # -- UI interaction -----------------------------------------------------
-
-    @mcp.tool
-    async def qt_ui_click(
-        objectId: str,
-        button: str | None = None,
-        position: dict | None = None,
-        ctx: Context = None,
-    ) -> dict:
+    ToolSpec(
+        "qt_ui_click", "qt.ui.click",
         """Click on a widget, optionally specifying button and position.
-        Example: qt_ui_click(objectId="submitButton")
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"objectId": objectId}
-        if button is not None:
-            params["button"] = button
-        if position is not None:
-            params["position"] = position
-        return await require_probe().call("qt.ui.click", params)
-
-    @mcp.tool
-    async def qt_ui_sendKeys(
-        objectId: str,
-        text: str | None = None,
-        sequence: str | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: qt_ui_click(objectId="submitButton")""",
+        (_OBJECT_ID, Arg("button", str | None, None), Arg("position", dict | None, None)),
+    ),
+    ToolSpec(
+        "qt_ui_sendKeys", "qt.ui.sendKeys",
         """Send key input to a widget (text or key sequence).
-        Example: qt_ui_sendKeys(objectId="lineEdit", text="hello")
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"objectId": objectId}
-        if text is not None:
-            params["text"] = text
-        if sequence is not None:
-            params["sequence"] = sequence
-        return await require_probe().call("qt.ui.sendKeys", params)
-
-    @mcp.tool
-    async def qt_ui_screenshot(
-        objectId: str,
-        fullWindow: bool | None = None,
-        region: dict | None = None,
-        ctx: Context = None,
-    ) -> dict:
+Example: qt_ui_sendKeys(objectId="lineEdit", text="hello")""",
+        (_OBJECT_ID, Arg("text", str | None, None), Arg("sequence", str | None, None)),
+    ),
+    ToolSpec(
+        "qt_ui_screenshot", "qt.ui.screenshot",
         """Capture a screenshot of a widget as base64 PNG.
-        Example: qt_ui_screenshot(objectId="MainWindow")
-        """
-        from qtpilot.server import require_probe
-
-        params: dict = {"objectId": objectId}
-        if fullWindow is not None:
-            params["fullWindow"] = fullWindow
-        if region is not None:
-            params["region"] = region
-        return await require_probe().call("qt.ui.screenshot", params)
-
-    @mcp.tool
-    async def qt_ui_geometry(objectId: str, ctx: Context = None) -> dict:
+Example: qt_ui_screenshot(objectId="MainWindow")""",
+        (_OBJECT_ID, Arg("fullWindow", bool | None, None), Arg("region", dict | None, None)),
+    ),
+    ToolSpec(
+        "qt_ui_geometry", "qt.ui.geometry",
         """Get the geometry (position, size) of a widget.
-        Example: qt_ui_geometry(objectId="MainWindow")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.ui.geometry", {"objectId": objectId})
-
-    @mcp.tool
-    async def qt_ui_hitTest(x: int, y: int, ctx: Context = None) -> dict:
+Example: qt_ui_geometry(objectId="MainWindow")""",
+        (_OBJECT_ID,),
+    ),
+    ToolSpec(
+        "qt_ui_hitTest", "qt.ui.hitTest",
         """Find the widget at the given screen coordinates.
-        Example: qt_ui_hitTest(x=100, y=200)
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.ui.hitTest", {"x": x, "y": y})
-
+Example: qt_ui_hitTest(x=100, y=200)""",
+        (Arg("x", int), Arg("y", int)),
+    ),
     # -- Named objects ------------------------------------------------------
-
-    @mcp.tool
-    async def qt_names_register(name: str, path: str, ctx: Context = None) -> dict:
+    ToolSpec(
+        "qt_names_register", "qt.names.register",
         """Register a friendly name for an object path.
-        Example: qt_names_register(name="submit", path="MainWindow.centralWidget.submitBtn")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.names.register", {"name": name, "path": path})
-
-    @mcp.tool
-    async def qt_names_unregister(name: str, ctx: Context = None) -> dict:
+Example: qt_names_register(name="submit", path="MainWindow.centralWidget.submitBtn")""",
+        (Arg("name", str), Arg("path", str)),
+    ),
+    ToolSpec(
+        "qt_names_unregister", "qt.names.unregister",
         """Remove a registered name.
-        Example: qt_names_unregister(name="submit")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.names.unregister", {"name": name})
-
-    @mcp.tool
-    async def qt_names_list(ctx: Context) -> dict:
+Example: qt_names_unregister(name="submit")""",
+        (Arg("name", str),),
+    ),
+    ToolSpec(
+        "qt_names_list", "qt.names.list",
         """List all registered friendly names.
-        Example: qt_names_list()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.names.list")
-
-    @mcp.tool
-    async def qt_names_validate(ctx: Context) -> dict:
+Example: qt_names_list()""",
+    ),
+    ToolSpec(
+        "qt_names_validate", "qt.names.validate",
         """Validate that all registered names still resolve.
-        Example: qt_names_validate()
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.names.validate")
-
-    @mcp.tool
-    async def qt_names_load(filePath: str, ctx: Context = None) -> dict:
+Example: qt_names_validate()""",
+    ),
+    ToolSpec(
+        "qt_names_load", "qt.names.load",
         """Load name registrations from a file.
-        Example: qt_names_load(filePath="names.json")
-        """
-        from qtpilot.server import require_probe
-
-        return await require_probe().call("qt.names.load", {"filePath": filePath})
-
+Example: qt_names_load(filePath="names.json")""",
+        (Arg("filePath", str),),
+    ),
     # -- Models -------------------------------------------------------------
-
-    @mcp.tool
-    async def qt_models_list(ctx: Context) -> dict:
+    ToolSpec(
+        "qt_models_list", "qt.models.list",
         """List all QAbstractItemModel instances in the application.
-        Example: qt_models_list()
-        """
-        from qtpilot.server import require_probe
+Example: qt_models_list()""",
+    ),
+    ToolSpec(
+        "qt_models_data", "qt.models.data",
+        """Read rows from a model/view, at any depth via `parent` row-path.
 
-        return await require_probe().call("qt.models.list")
+`parent=[]` (or omitted) returns top-level rows. `parent=[0, 2]` returns
+the children of the third child of the first top-level row. Each returned
+row carries a full `path` field and a `hasChildren` flag so callers can
+recurse. Pagination via `offset`/`limit` applies to children of `parent`.
+Lazy models (canFetchMore) are force-fetched at each level.
+Example: qt_models_data(objectId="treeView", parent=[0], limit=50)""",
+        (
+            _OBJECT_ID,
+            Arg("parent", list[int] | None, None),
+            Arg("offset", int | None, None),
+            Arg("limit", int | None, None),
+            Arg("roles", list[str] | None, None),
+        ),
+    ),
+    ToolSpec(
+        "qt_models_search", "qt.models.search",
+        """Search a model recursively for rows whose cell value matches `value`.
 
-    @mcp.tool
-    async def qt_models_data(
-        objectId: str,
-        parent: list[int] | None = None,
-        offset: int | None = None,
-        limit: int | None = None,
-        roles: list[str] | None = None,
-        ctx: Context = None,
-    ) -> dict:
-        """Read rows from a model/view, at any depth via `parent` row-path.
+`match` one of "exact", "contains", "startsWith", "endsWith", "regex".
+Matching is case-insensitive. `max_hits=-1` = unlimited. `parent=[...]`
+restricts the search to that subtree. Lazy models are force-fetched at
+each level (no false negatives).
+Returns: {matches: [{path, cells}], count, truncated}.
+Example: qt_models_search(objectId="treeView", value="Aura", match="contains")""",
+        (
+            _OBJECT_ID,
+            Arg("value", str),
+            Arg("column", int, 0),
+            Arg("role", str, "display"),
+            Arg("match", str, "contains"),
+            Arg("max_hits", int, 10, key="maxHits"),
+            Arg("parent", list[int] | None, None),
+        ),
+    ),
+)
 
-        `parent=[]` (or omitted) returns top-level rows. `parent=[0, 2]` returns
-        the children of the third child of the first top-level row. Each returned
-        row carries a full `path` field and a `hasChildren` flag so callers can
-        recurse. Pagination via `offset`/`limit` applies to children of `parent`.
-        Lazy models (canFetchMore) are force-fetched at each level.
-        Example: qt_models_data(objectId="treeView", parent=[0], limit=50)
-        """
-        from qtpilot.server import require_probe
 
-        params: dict = {"objectId": objectId}
-        if parent is not None:
-            params["parent"] = parent
-        if offset is not None:
-            params["offset"] = offset
-        if limit is not None:
-            params["limit"] = limit
-        if roles is not None:
-            params["roles"] = roles
-        return await require_probe().call("qt.models.data", params)
+def register_native_tools(mcp: FastMCP) -> None:
+    """Register all native mode tools on the MCP server."""
+    register_forwarders(mcp, NATIVE_TOOLS)
 
-    @mcp.tool
-    async def qt_models_search(
-        objectId: str,
-        value: str,
-        column: int = 0,
-        role: str = "display",
-        match: str = "contains",
-        max_hits: int = 10,
-        parent: list[int] | None = None,
-        ctx: Context = None,
-    ) -> dict:
-        """Search a model recursively for rows whose cell value matches `value`.
+    # Tools below do more than forward their arguments, so stay hand-written.
 
-        `match` one of "exact", "contains", "startsWith", "endsWith", "regex".
-        Matching is case-insensitive. `max_hits=-1` = unlimited. `parent=[...]`
-        restricts the search to that subtree. Lazy models are force-fetched at
-        each level (no false negatives).
-        Returns: {matches: [{path, cells}], count, truncated}.
-        Example: qt_models_search(objectId="treeView", value="Aura", match="contains")
+    @mcp.tool
+    async def qt_batch(calls: list[dict]) -> dict:
+        """Run several qt.* probe methods in one round trip.
+
+        Each entry is {"method": "qt.objects.inspect", "params": {...}}; params
+        may be omitted, and method must start with "qt.". Requests are
+        pipelined, so the batch costs about one round trip instead of one per
+        call. Results come back in the same order, each as {"result": ...} or
+        {"error": {"code": ..., "message": ...}}; a failed call does not affect
+        the others.
+
+        Example: qt_batch(calls=[{"method": "qt.properties.get",
+                 "params": {"objectId": "MainWindow", "name": "windowTitle"}},
+                 {"method": "qt.ui.geometry", "params": {"objectId": "MainWindow"}}])
         """
-        from qtpilot.server import require_probe
-
-        params: dict = {
-            "objectId": objectId,
-            "value": value,
-            "column": column,
-            "role": role,
-            "match": match,
-            "maxHits": max_hits,
-        }
-        if parent is not None:
-            params["parent"] = parent
-        return await require_probe().call("qt.models.search", params)
+        for i, entry in enumerate(calls):
+            if not isinstance(entry, dict):
+                raise ValueError(f"calls[{i}] must be an object, got {type(entry).__name__}")
+            method = entry.get("method")
+            if not isinstance(method, str) or not method.startswith("qt."):
+                raise ValueError(f"calls[{i}] needs a 'method' string starting with 'qt.'")
+            if not isinstance(entry.get("params", {}), dict | None):
+                raise ValueError(f"calls[{i}] 'params' must be an object")
+
+        outcomes = await require_probe().call_many(
+            [(entry["method"], entry.get("params")) for entry in calls]
+        )
+        results: list[dict] = []
+        for outcome in outcomes:
+            if isinstance(outcome, ProbeError):
+                results.append({"error": {"code": outcome.code, "message": outcome.message}})
+            elif isinstance(outcome, BaseException):
+                # Connection loss, cancellation, etc.: report it for this entry
+                # rather than discarding the results that did come back.
+                results.append({"error": {
+                    "code": -1, "message": f"{type(outcome).__name__}: {outcome}",
+                }})
+            else:
+                results.append({"result": outcome})
+        return {"results": results}
 
     @mcp.tool
     async def qt_ui_clickItem(
@@ -426,7 +297,6 @@ def register_native_tools(mcp: FastMCP) -> None:
         editColumn: int | None = None,
         expand: bool = True,
         scroll: bool = True,
-        ctx: Context = None,
     ) -> dict:
         """Select / click / double-click / edit an item in a view.
 
@@ -438,8 +308,6 @@ def register_native_tools(mcp: FastMCP) -> None:
         paths must be length 1 and `edit` returns kNotEditable.
         Example: qt_ui_clickItem(objectId="treeView", itemPath=["ETC","fos4 Fresnel"])
         """
-        from qtpilot.server import require_probe
-
         if (itemPath is None) == (path is None):
             raise ValueError("Exactly one of itemPath or path must be provided")
         params: dict = {
@@ -449,10 +317,9 @@ def register_native_tools(mcp: FastMCP) -> None:
             "expand": expand,
             "scroll": scroll,
         }
-        if itemPath is not None:
-            params["itemPath"] = itemPath
-        if path is not None:
-            params["path"] = path
-        if editColumn is not None:
-            params["editColumn"] = editColumn
+        params.update(
+            (k, v)
+            for k, v in (("itemPath", itemPath), ("path", path), ("editColumn", editColumn))
+            if v is not None
+        )
         return await require_probe().call("qt.ui.clickItem", params)
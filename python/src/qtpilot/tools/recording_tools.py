@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from fastmcp import Context, FastMCP
+from pydantic import Field
 
 from qtpilot.event_recorder import TargetSpec
+from qtpilot.server import get_recorder, require_probe
 
 
 def register_recording_tools(mcp: FastMCP) -> None:
@@ -15,6 +17,7 @@ def register_recording_tools(mcp: FastMCP) -> None:
         targets: list[dict],
         include_lifecycle: bool = True,
         capture_events: bool = True,
+        max_events: int | None = Field(default=None, ge=1),
         ctx: Context = None,
     ) -> dict:
         """Start recording Qt signals on specified objects.
@@ -32,11 +35,11 @@ def register_recording_tools(mcp: FastMCP) -> None:
             capture_events: Enable global event capture for mouse, keyboard, and
                 focus events (default true). When enabled, the probe installs a
                 global event filter so no per-widget subscription is needed.
+            max_events: Keep only the most recent this many events, so a long
+                recording has bounded memory. Omit to keep every event.
 
         Example: qtpilot_recording_start(targets=[{"object_id": "MainWindow", "recursive": true}])
         """
-        from qtpilot.server import get_recorder, require_probe
-
         probe = require_probe()
         recorder = get_recorder()
 
@@ -50,7 +53,11 @@ def register_recording_tools(mcp: FastMCP) -> None:
         ]
 
         return await recorder.start(
-            probe, specs, include_lifecycle=include_lifecycle, capture_events=capture_events
+            probe,
+            specs,
+            include_lifecycle=include_lifecycle,
+            capture_events=capture_events,
+            max_events=max_events,
         )
 
     @mcp.tool
@@ -62,8 +69,6 @@ def register_recording_tools(mcp: FastMCP) -> None:
 
         Example: qtpilot_recording_stop()
         """
-        from qtpilot.server import get_recorder, require_probe
-
         probe = require_probe()
         recorder = get_recorder()
 
@@ -77,6 +82,4 @@ def register_recording_tools(mcp: FastMCP) -> None:
 
         Example: qtpilot_recording_status()
         """
-        from qtpilot.server import get_recorder
-
         return get_recorder().status()
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
+from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,47 +12,74 @@ import pytest_asyncio
 
 from fastmcp import FastMCP
 
+from qtpilot import _json
 from qtpilot.connection import ProbeConnection
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path under RAM-backed /dev/shm when available.
+
+    Extraction/download tests write real archives; tmpfs avoids disk latency
+    on CI runners. PYTEST_DEBUG_TEMPROOT keeps pytest's per-user, numbered
+    directory layout and retention, and an explicit setting wins.
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
+
 class MockWebSocket:
     """Simulates a WebSocket connection for unit testing.
 
     Records sent messages and returns pre-configured responses
-    keyed by JSON-RPC request id.
+    keyed by JSON-RPC request id. Responses and injected notifications
+    are queued as encoded frames for recv() in the order they arrive.
     """
 
     def __init__(self) -> None:
         self.sent_messages: list[str] = []
         self.responses: dict[int, dict] = {}
-        self._pending_responses: asyncio.Queue[str] = asyncio.Queue()
+        self._ready: deque[str] = deque()
+        self._wakeup = asyncio.Event()
         self._closed = False
 
+    def _deliver(self, frame: str) -> None:
+        """Queue an encoded frame for recv(), waking a waiting reader."""
+        self._ready.append(frame)
+        self._wakeup.set()
+
     async def send(self, msg: str) -> None:
-        """Record sent message and queue the matching response."""
+        """Record sent message and resolve the matching response."""
         self.sent_messages.append(msg)
-        parsed = json.loads(msg)
+        parsed = _json.loads(msg)
         req_id = parsed.get("id")
         if req_id is not None and req_id in self.responses:
-            resp = self.responses[req_id]
-            await self._pending_responses.put(json.dumps(resp))
+            self._deliver(_json.dumps(self.responses[req_id]))
 
-    async def recv(self) -> str:
-        """Return the next queued response."""
-        return await self._pending_responses.get()
+    async def recv(self, decode: bool | None = None) -> str | bytes:
+        """Return the next queued frame; UTF-8 bytes if decode is False."""
+        while not self._ready:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        message = self._ready.popleft()
+        return message.encode() if decode is False else message
 
     def __aiter__(self):
         return self
 
     async def __anext__(self) -> str:
         try:
-            return await asyncio.wait_for(self._pending_responses.get(), timeout=0.5)
+            return await asyncio.wait_for(self.recv(), timeout=0.5)
         except asyncio.TimeoutError:
             raise StopAsyncIteration
 
     async def inject_notification(self, notification: dict) -> None:
         """Simulate a probe push notification (no id, has method)."""
-        await self._pending_responses.put(json.dumps(notification))
+        self._deliver(_json.dumps(notification))
+
+    async def drain(self) -> None:
+        """Wait until recv() has taken every queued frame."""
+        while self._ready:
+            await asyncio.sleep(0)
 
     async def close(self) -> None:
         self._closed = True
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import json
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
+from websockets.exceptions import ConnectionClosedOK
+from websockets.frames import Close
 
 from qtpilot.connection import ProbeConnection, ProbeError
 
@@ -87,3 +90,99 @@ async def test_call_when_disconnected_raises():
 
     with pytest.raises(ProbeError, match="Not connected"):
         await probe.call("qt.ping")
+
+
+async def test_call_many_returns_results_in_order(mock_probe):
+    """Verify call_many() sends every request and returns per-call outcomes."""
+    probe, mock_ws = mock_probe
+
+    mock_ws.responses[1] = {"jsonrpc": "2.0", "result": {"pong": True}, "id": 1}
+    mock_ws.responses[2] = {
+        "jsonrpc": "2.0",
+        "error": {"code": -32601, "message": "Method not found"},
+        "id": 2,
+    }
+    mock_ws.responses[3] = {"jsonrpc": "2.0", "result": {"qt": "6.8"}, "id": 3}
+
+    results = await probe.call_many([
+        ("qt.ping", None),
+        ("qt.nonexistent", {}),
+        ("qt.version", None),
+    ])
+
+    assert [json.loads(m)["method"] for m in mock_ws.sent_messages] == [
+        "qt.ping", "qt.nonexistent", "qt.version",
+    ]
+    assert results[0] == {"pong": True}
+    assert isinstance(results[1], ProbeError)
+    assert results[1].code == -32601
+    assert results[2] == {"qt": "6.8"}
+
+
+async def test_empty_params_requests_reuse_cached_encoding(mock_probe):
+    """Verify repeated no-params calls still encode their own IDs."""
+    probe, mock_ws = mock_probe
+
+    for i in (1, 2):
+        mock_ws.responses[i] = {"jsonrpc": "2.0", "result": {}, "id": i}
+        await probe.call("qt.names.list")
+
+    assert [json.loads(m) for m in mock_ws.sent_messages] == [
+        {"jsonrpc": "2.0", "method": "qt.names.list", "params": {}, "id": 1},
+        {"jsonrpc": "2.0", "method": "qt.names.list", "params": {}, "id": 2},
+    ]
+
+
+async def test_recv_loop_reads_undecoded_frames(mock_ws):
+    """The recv loop asks for raw bytes and still resolves responses."""
+    probe = ProbeConnection("ws://localhost:9222")
+    decode_args = []
+    recv = mock_ws.recv
+
+    async def spy_recv(decode=None):
+        decode_args.append(decode)
+        return await recv(decode)
+
+    mock_ws.recv = spy_recv
+    with patch("qtpilot.connection.connect", AsyncMock(return_value=mock_ws)):
+        await probe.connect()
+    try:
+        mock_ws.responses[1] = {"jsonrpc": "2.0", "result": {"pong": True}, "id": 1}
+        assert await probe.call("qt.ping") == {"pong": True}
+        assert decode_args and set(decode_args) == {False}
+    finally:
+        await probe.disconnect()
+
+
+async def test_normal_close_ends_recv_loop(mock_ws):
+    """A normal close stops the recv loop and fails pending calls."""
+    probe = ProbeConnection("ws://localhost:9222")
+    closed = asyncio.Event()
+
+    async def recv(decode=None):
+        await closed.wait()
+        raise ConnectionClosedOK(Close(1000, ""), Close(1000, ""), True)
+
+    mock_ws.recv = recv
+    with patch("qtpilot.connection.connect", AsyncMock(return_value=mock_ws)):
+        await probe.connect()
+
+    call = asyncio.create_task(probe.call("qt.ping"))
+    await asyncio.sleep(0)
+    closed.set()
+
+    with pytest.raises(ConnectionError):
+        await call
+    assert probe.is_connected is False
+    await probe.disconnect()
+
+
+async def test_malformed_frame_is_skipped(mock_probe):
+    """A frame that is not valid JSON is ignored; later responses still resolve."""
+    probe, mock_ws = mock_probe
+
+    mock_ws._deliver("not json{")
+
+    mock_ws.responses[1] = {"jsonrpc": "2.0", "result": {"pong": True}, "id": 1}
+    assert await probe.call("qt.ping") == {"pong": True}
+    assert probe.is_connected
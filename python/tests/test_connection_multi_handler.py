@@ -24,7 +24,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {"objectId": "btn", "signal": "clicked"},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         assert len(received_a) == 1
         assert len(received_b) == 1
@@ -43,7 +44,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 1
 
         probe.remove_notification_handler(handler)
@@ -53,7 +55,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 1  # no new
 
     async def test_remove_unregistered_handler_is_noop(self, mock_probe):
@@ -77,7 +80,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         assert len(received) == 1  # second handler still ran
 
@@ -94,7 +98,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 1
 
     async def test_on_notification_clears_add_handlers(self, mock_probe):
@@ -112,7 +117,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         assert len(received_add) == 0  # cleared by on_notification
         assert len(received_on) == 1
@@ -137,7 +143,8 @@ class TestMultiNotificationHandlers:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 0
 
 
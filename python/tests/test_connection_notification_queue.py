@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -31,20 +32,54 @@ async def test_notifications_dispatched_async(mock_probe):
         "params": {"objectId": "btn1"},
     })
 
-    # Give the recv loop and dispatcher time to process
-    await asyncio.sleep(0.2)
+    await mock_ws.drain()
+    await probe.wait_idle()
 
     assert len(received) == 1
     assert received[0][0] == "qtpilot.signalEmitted"
     assert received[0][1] == {"objectId": "btn1"}
 
 
-async def test_notification_queue_full_drops(mock_probe):
-    """Verify drops are counted when the notification queue is full."""
-    probe, mock_ws = mock_probe
+async def test_queued_notifications_dispatched_in_order(mock_probe):
+    """Notifications already queued reach handlers in arrival order."""
+    probe, _ = mock_probe
+
+    received = []
+    probe.add_notification_handler(lambda method, params: received.append(method))
+
+    for i in range(3):
+        probe._notification_queue.put_nowait((f"ntf.{i}", {}))
+    await probe.wait_idle()
 
-    # Replace the queue with a tiny one to test overflow
+    assert received == ["ntf.0", "ntf.1", "ntf.2"]
+
+
+async def test_handler_removed_mid_burst_gets_no_more(mock_probe):
+    """A handler removed while dispatching misses notifications queued behind it."""
+    probe, _ = mock_probe
+
+    received = []
+
+    def once(method, params):
+        received.append(method)
+        probe.remove_notification_handler(once)
+
+    probe.add_notification_handler(once)
+    for i in range(2):
+        probe._notification_queue.put_nowait((f"ntf.{i}", {}))
+    await probe.wait_idle()
+
+    assert received == ["ntf.0"]
+
+
+async def test_notification_queue_full_drops(mock_ws):
+    """Verify drops are counted when the notification queue is full."""
+    # Use a tiny queue to test overflow. It must be in place before connect()
+    # so the dispatcher consumes from it.
+    probe = ProbeConnection("ws://localhost:9222")
     probe._notification_queue = asyncio.Queue(maxsize=2)
+    with patch("qtpilot.connection.connect", AsyncMock(return_value=mock_ws)):
+        await probe.connect()
 
     received = []
 
@@ -61,11 +96,12 @@ async def test_notification_queue_full_drops(mock_probe):
             "params": {},
         })
 
-    # Let recv loop process them
-    await asyncio.sleep(0.3)
+    await mock_ws.drain()
+    await probe.wait_idle()
 
     # Some should have been dropped (queue maxsize=2 + whatever was consumed)
     assert probe.notification_drops >= 1
+    await probe.disconnect()
 
 
 async def test_recv_loop_not_blocked_by_slow_handler(mock_probe):
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import io
-import sys
 import tarfile
+import threading
+import time
 import urllib.error
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 from unittest import mock
 
 import pytest
@@ -23,10 +26,12 @@ from qtpilot.download import (
     UnsupportedPlatformError,
     VersionNotFoundError,
     _default_release_tag,
+    _integrity_sha256,
     build_archive_url,
     build_checksums_url,
     detect_platform,
     download_and_extract,
+    download_many,
     extract_archive,
     get_archive_filename,
     get_launcher_filename,
@@ -37,31 +42,109 @@ from qtpilot.download import (
 )
 
 
-class TestPlatformDetection:
-    """Tests for platform detection logic."""
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Forget cached platform and release tag so tests can patch their inputs."""
+    detect_platform.cache_clear()
+    _default_release_tag.cache_clear()
+    yield
+    detect_platform.cache_clear()
+    _default_release_tag.cache_clear()
+
+
+@pytest.fixture
+def sys_platform(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Pretend to run on the sys.platform given by indirect parametrization."""
+    monkeypatch.setattr("qtpilot.download.sys.platform", request.param)
+    return request.param
+
+
+# Payloads of the fake release archive built by sample_zip
+PROBE_CONTENT = b"probe"
+LAUNCHER_CONTENT = b"launcher"
+
+
+class SampleZip(NamedTuple):
+    """A prebuilt Windows release archive and its SHA-256 digest."""
+
+    data: bytes
+    sha256: str
+
+
+@pytest.fixture(scope="session")
+def sample_zip() -> SampleZip:
+    """Build the probe + launcher zip once for the whole session."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("qtPilot-probe.dll", PROBE_CONTENT)
+        zf.writestr("qtPilot-launcher.exe", LAUNCHER_CONTENT)
+    data = buf.getvalue()
+    return SampleZip(data, hashlib.sha256(data).hexdigest())
+
+
+UrlHandler = Callable[[str], BinaryIO]
+FakeUrlopen = Callable[[UrlHandler], list[str]]
+
+
+@pytest.fixture
+def fake_urlopen(monkeypatch: pytest.MonkeyPatch) -> FakeUrlopen:
+    """Route the download module's urlopen calls to a handler.
+
+    Calling the fixture with a handler (URL -> response) installs it and
+    returns the list that records every requested URL.
+    """
+    def install(handler: UrlHandler) -> list[str]:
+        urls: list[str] = []
+
+        def urlopen(url: str, timeout: float | None = None) -> BinaryIO:
+            urls.append(url)
+            return handler(url)
+
+        monkeypatch.setattr("urllib.request.urlopen", urlopen)
+        return urls
+
+    return install
 
-    def test_linux_platform_detection(self) -> None:
-        """Linux platforms should return 'linux'."""
-        with mock.patch("qtpilot.download.sys.platform", "linux"):
-            assert detect_platform() == "linux"
 
-    def test_linux2_platform_detection(self) -> None:
-        """linux2 (older Python) should also work."""
-        with mock.patch("qtpilot.download.sys.platform", "linux2"):
-            assert detect_platform() == "linux"
+def serve(archive: bytes, checksums: bytes = b"") -> UrlHandler:
+    """Handler answering SHA256SUMS requests with `checksums`, others with `archive`."""
+    def handler(url: str) -> BinaryIO:
+        return io.BytesIO(checksums if url.endswith("/SHA256SUMS") else archive)
 
-    def test_win32_platform_detection(self) -> None:
-        """Windows platforms should return 'windows'."""
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            assert detect_platform() == "windows"
+    return handler
 
-    def test_unsupported_platform_raises(self) -> None:
+
+def fail_with(exc: Exception) -> UrlHandler:
+    """Handler that raises `exc` for every request."""
+    def handler(url: str) -> BinaryIO:
+        raise exc
+
+    return handler
+
+
+class TestPlatformDetection:
+    """Tests for platform detection logic."""
+
+    @pytest.mark.parametrize(
+        ("sys_platform", "expected"),
+        [
+            ("linux", "linux"),
+            ("linux2", "linux"),  # older Python
+            ("win32", "windows"),
+        ],
+        indirect=["sys_platform"],
+    )
+    def test_platform_detection(self, sys_platform: str, expected: str) -> None:
+        """Supported sys.platform values map to 'linux' or 'windows'."""
+        assert detect_platform() == expected
+
+    @pytest.mark.parametrize("sys_platform", ["darwin"], indirect=True)
+    def test_unsupported_platform_raises(self, sys_platform: str) -> None:
         """Unsupported platforms should raise UnsupportedPlatformError."""
-        with mock.patch("qtpilot.download.sys.platform", "darwin"):
-            with pytest.raises(UnsupportedPlatformError) as exc_info:
-                detect_platform()
-            assert "darwin" in str(exc_info.value)
-            assert "Supported platforms" in str(exc_info.value)
+        with pytest.raises(UnsupportedPlatformError) as exc_info:
+            detect_platform()
+        assert "darwin" in str(exc_info.value)
+        assert "Supported platforms" in str(exc_info.value)
 
 
 class TestDefaultReleaseTag:
@@ -82,6 +165,14 @@ class TestDefaultReleaseTag:
         with mock.patch("qtpilot.download._pkg_version", return_value="0.2.0.post1"):
             assert _default_release_tag() == "v0.2.0"
 
+    def test_package_metadata_read_once(self) -> None:
+        """The tag is cached, so 'latest' lookups don't re-read package metadata."""
+        with mock.patch("qtpilot.download._pkg_version", return_value="0.3.0") as pkg_version:
+            build_archive_url("6.8", release_tag="latest", platform_name="linux")
+            build_checksums_url("latest")
+            assert _default_release_tag() == "v0.3.0"
+        pkg_version.assert_called_once_with("qtpilot")
+
 
 class TestVersionNormalization:
     """Tests for Qt version normalization."""
@@ -100,89 +191,82 @@ class TestVersionNormalization:
         assert normalize_version("5.15-patched") == "5.15-patched"
         assert normalize_version("5.15.1-patched") == "5.15-patched"
 
+    @pytest.mark.parametrize("version", ["6", "latest", "-patched"])
+    def test_version_without_minor_returned_as_is(self, version: str) -> None:
+        """Strings without a major.minor part are returned unchanged."""
+        assert normalize_version(version) == version
 
-class TestFilenames:
-    """Tests for simplified filename generation."""
-
-    def test_probe_filename_windows(self) -> None:
-        """Windows probe filename."""
-        assert get_probe_filename("windows") == "qtPilot-probe.dll"
-
-    def test_probe_filename_linux(self) -> None:
-        """Linux probe filename."""
-        assert get_probe_filename("linux") == "qtPilot-probe.so"
-
-    def test_probe_filename_auto_detect(self) -> None:
-        """Probe filename auto-detects platform."""
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            assert get_probe_filename() == "qtPilot-probe.dll"
-        with mock.patch("qtpilot.download.sys.platform", "linux"):
-            assert get_probe_filename() == "qtPilot-probe.so"
+    def test_trailing_newline_in_extra_component_dropped(self) -> None:
+        """A version read from a file keeps only major.minor."""
+        assert normalize_version("6.8.0\n") == "6.8"
 
-    def test_launcher_filename_windows(self) -> None:
-        """Windows launcher filename."""
-        assert get_launcher_filename("windows") == "qtPilot-launcher.exe"
 
-    def test_launcher_filename_linux(self) -> None:
-        """Linux launcher filename."""
-        assert get_launcher_filename("linux") == "qtPilot-launcher"
+class TestFilenames:
+    """Tests for simplified filename generation."""
 
-    def test_launcher_filename_auto_detect(self) -> None:
-        """Launcher filename auto-detects platform."""
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            assert get_launcher_filename() == "qtPilot-launcher.exe"
-        with mock.patch("qtpilot.download.sys.platform", "linux"):
-            assert get_launcher_filename() == "qtPilot-launcher"
+    @pytest.mark.parametrize(
+        ("func", "platform_name", "expected"),
+        [
+            (get_probe_filename, "windows", "qtPilot-probe.dll"),
+            (get_probe_filename, "linux", "qtPilot-probe.so"),
+            (get_launcher_filename, "windows", "qtPilot-launcher.exe"),
+            (get_launcher_filename, "linux", "qtPilot-launcher"),
+        ],
+    )
+    def test_filename_for_platform(self, func, platform_name: str, expected: str) -> None:
+        """Probe and launcher filenames for an explicit platform."""
+        assert func(platform_name) == expected
+
+    @pytest.mark.parametrize(
+        ("func", "sys_platform", "expected"),
+        [
+            (get_probe_filename, "win32", "qtPilot-probe.dll"),
+            (get_probe_filename, "linux", "qtPilot-probe.so"),
+            (get_launcher_filename, "win32", "qtPilot-launcher.exe"),
+            (get_launcher_filename, "linux", "qtPilot-launcher"),
+        ],
+        indirect=["sys_platform"],
+    )
+    def test_filename_auto_detect(self, func, sys_platform: str, expected: str) -> None:
+        """Probe and launcher filenames auto-detect the platform."""
+        assert func() == expected
 
 
 class TestArchiveFilename:
     """Tests for archive filename generation."""
 
-    def test_windows_zip_default_x64(self) -> None:
-        """Windows archives default to x64 and include arch suffix."""
+    @pytest.mark.parametrize(
+        ("version", "platform_name", "arch", "expected"),
+        [
+            # Windows archives default to x64 and always include the arch suffix
+            ("6.8", "windows", None, "qtpilot-qt6.8-windows-x64.zip"),
+            ("6.8", "windows", "x64", "qtpilot-qt6.8-windows-x64.zip"),
+            ("6.8", "windows", "x86", "qtpilot-qt6.8-windows-x86.zip"),
+            # Linux x64 archives have no arch suffix (backward compat)
+            ("6.8", "linux", None, "qtpilot-qt6.8-linux.tar.gz"),
+            ("6.8", "linux", "x64", "qtpilot-qt6.8-linux.tar.gz"),
+            ("6.8", "linux", "x86", "qtpilot-qt6.8-linux-x86.tar.gz"),
+            # Patched versions are preserved, full versions normalized
+            ("5.15-patched", "linux", None, "qtpilot-qt5.15-patched-linux.tar.gz"),
+            ("5.15-patched", "linux", "x86", "qtpilot-qt5.15-patched-linux-x86.tar.gz"),
+            ("6.8.0", "windows", None, "qtpilot-qt6.8-windows-x64.zip"),
+        ],
+    )
+    def test_archive_filename(
+        self, version: str, platform_name: str, arch: str | None, expected: str
+    ) -> None:
+        """Archive filename for a version, platform, and architecture."""
+        assert get_archive_filename(version, platform_name, arch=arch) == expected
+
+    def test_arch_omitted_defaults_to_x64(self) -> None:
+        """Omitting arch behaves like x64."""
         assert get_archive_filename("6.8", "windows") == "qtpilot-qt6.8-windows-x64.zip"
-
-    def test_windows_zip_explicit_x64(self) -> None:
-        """Windows archives with explicit x64."""
-        assert get_archive_filename("6.8", "windows", arch="x64") == "qtpilot-qt6.8-windows-x64.zip"
-
-    def test_windows_zip_x86(self) -> None:
-        """Windows x86 archives include -x86 suffix."""
-        assert get_archive_filename("6.8", "windows", arch="x86") == "qtpilot-qt6.8-windows-x86.zip"
-
-    def test_linux_tar_gz_default_x64(self) -> None:
-        """Linux x64 archives have no arch suffix (backward compat)."""
         assert get_archive_filename("6.8", "linux") == "qtpilot-qt6.8-linux.tar.gz"
 
-    def test_linux_tar_gz_explicit_x64(self) -> None:
-        """Linux with explicit x64 has no arch suffix."""
-        assert get_archive_filename("6.8", "linux", arch="x64") == "qtpilot-qt6.8-linux.tar.gz"
-
-    def test_linux_tar_gz_x86(self) -> None:
-        """Linux x86 archives include -x86 suffix."""
-        assert get_archive_filename("6.8", "linux", arch="x86") == "qtpilot-qt6.8-linux-x86.tar.gz"
-
-    def test_patched_version(self) -> None:
-        """Patched versions should be preserved in filename."""
-        assert get_archive_filename("5.15-patched", "linux") == "qtpilot-qt5.15-patched-linux.tar.gz"
-
-    def test_patched_version_x86(self) -> None:
-        """Patched version with x86 arch."""
-        assert get_archive_filename("5.15-patched", "linux", arch="x86") == "qtpilot-qt5.15-patched-linux-x86.tar.gz"
-
-    def test_version_normalization(self) -> None:
-        """Full version strings should be normalized."""
-        assert get_archive_filename("6.8.0", "windows") == "qtpilot-qt6.8-windows-x64.zip"
-
-    def test_auto_detect_platform(self) -> None:
+    @pytest.mark.parametrize("sys_platform", ["win32"], indirect=True)
+    def test_auto_detect_platform(self, sys_platform: str) -> None:
         """Platform should be auto-detected when not specified."""
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            assert get_archive_filename("6.8") == "qtpilot-qt6.8-windows-x64.zip"
-
-    def test_arch_none_defaults_to_x64(self) -> None:
-        """arch=None should default to x64 behavior."""
-        assert get_archive_filename("6.8", "windows", arch=None) == "qtpilot-qt6.8-windows-x64.zip"
-        assert get_archive_filename("6.8", "linux", arch=None) == "qtpilot-qt6.8-linux.tar.gz"
+        assert get_archive_filename("6.8") == "qtpilot-qt6.8-windows-x64.zip"
 
 
 class TestArchiveUrlBuilding:
@@ -259,6 +343,9 @@ class TestArchiveUrlBuilding:
             assert "/v0.2.0/" in url
 
 
+_BULK_CHECKSUMS = "\n".join(f"{i:064x}  file{i}.zip" for i in range(1000))
+
+
 class TestChecksumParsing:
     """Tests for SHA256SUMS file parsing."""
 
@@ -272,11 +359,19 @@ abc123def456  qtpilot-qt6.8-linux.tar.gz
         assert checksums["qtpilot-qt6.8-linux.tar.gz"] == "abc123def456"
         assert checksums["qtpilot-qt6.8-windows-x64.zip"] == "789xyz012abc"
 
-    def test_parse_binary_mode_format(self) -> None:
-        """Parse sha256sum binary mode format (asterisk prefix)."""
-        content = "abc123def456 *qtpilot-qt6.8-linux.tar.gz\n"
-        checksums = parse_checksums(content)
-        assert checksums["qtpilot-qt6.8-linux.tar.gz"] == "abc123def456"
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "abc123def456  qtpilot-qt6.8-linux.tar.gz\n",
+            "abc123def456 *qtpilot-qt6.8-linux.tar.gz\n",  # binary mode
+            "abc123def456\tqtpilot-qt6.8-linux.tar.gz\n",
+        ],
+        ids=["text", "binary", "tab"],
+    )
+    def test_parse_line_formats(self, line: str) -> None:
+        """Parse sha256sum text and binary mode (asterisk prefix) lines."""
+        checksums = parse_checksums(line)
+        assert checksums == {"qtpilot-qt6.8-linux.tar.gz": "abc123def456"}
 
     def test_parse_empty_lines_ignored(self) -> None:
         """Empty lines should be ignored."""
@@ -284,37 +379,87 @@ abc123def456  qtpilot-qt6.8-linux.tar.gz
         checksums = parse_checksums(content)
         assert len(checksums) == 1
 
+    def test_parse_many_entries(self) -> None:
+        """A release-sized SHA256SUMS file parses every entry."""
+        checksums = parse_checksums(_BULK_CHECKSUMS)
+        assert len(checksums) == 1000
+        assert checksums["file0.zip"] == f"{0:064x}"
+        assert checksums["file999.zip"] == f"{999:064x}"
+
+
+@pytest.fixture(scope="module")
+def hashed_file(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, str]:
+    """A small file on disk and its lowercase SHA-256 hex digest."""
+    content = b"test file content"
+    path = tmp_path_factory.mktemp("checksum") / "test.bin"
+    path.write_bytes(content)
+    return path, hashlib.sha256(content).hexdigest()
+
 
 class TestChecksumVerification:
     """Tests for checksum verification."""
 
-    def test_checksum_match(self, tmp_path: Path) -> None:
+    def test_checksum_match(self, hashed_file: tuple[Path, str]) -> None:
         """Checksum should match for correct file."""
-        content = b"test file content"
-        expected_hash = hashlib.sha256(content).hexdigest()
-
-        test_file = tmp_path / "test.bin"
-        test_file.write_bytes(content)
+        path, digest = hashed_file
+        assert verify_checksum(path, digest) is True
 
-        assert verify_checksum(test_file, expected_hash) is True
-
-    def test_checksum_mismatch(self, tmp_path: Path) -> None:
+    def test_checksum_mismatch(self, hashed_file: tuple[Path, str]) -> None:
         """Checksum should not match for incorrect file."""
-        test_file = tmp_path / "test.bin"
-        test_file.write_bytes(b"test content")
+        path, _ = hashed_file
+        assert verify_checksum(path, "0" * 64) is False
 
-        wrong_hash = "0" * 64
-        assert verify_checksum(test_file, wrong_hash) is False
+    @pytest.mark.parametrize("expected", ["abc123def456", "0" * 63, "g" * 64, ""])
+    def test_malformed_hash_rejected_without_reading(
+        self, tmp_path: Path, expected: str
+    ) -> None:
+        """A hash that is not 64 hex digits fails before the file is opened."""
+        assert verify_checksum(tmp_path / "missing.bin", expected) is False
 
-    def test_checksum_case_insensitive(self, tmp_path: Path) -> None:
+    def test_checksum_case_insensitive(self, hashed_file: tuple[Path, str]) -> None:
         """Checksum comparison should be case-insensitive."""
-        content = b"test"
-        expected_hash = hashlib.sha256(content).hexdigest().upper()
-
-        test_file = tmp_path / "test.bin"
-        test_file.write_bytes(content)
-
-        assert verify_checksum(test_file, expected_hash) is True
+        path, digest = hashed_file
+        assert verify_checksum(path, digest.upper()) is True
+
+    def test_checksum_uses_file_digest(
+        self, hashed_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files below the mmap threshold are hashed with hashlib.file_digest."""
+        calls = []
+        real_file_digest = hashlib.file_digest
+
+        def spy(fileobj, digest):
+            calls.append(digest)
+            return real_file_digest(fileobj, digest)
+
+        monkeypatch.setattr("hashlib.file_digest", spy)
+        path, digest = hashed_file
+        assert verify_checksum(path, digest) is True
+        assert calls == [_integrity_sha256]
+
+    def test_integrity_hash_not_marked_for_security(self) -> None:
+        """Integrity digests are plain SHA-256, created with usedforsecurity=False."""
+        expected = hashlib.sha256(b"abc").hexdigest()
+        with mock.patch("hashlib.sha256", wraps=hashlib.sha256) as sha256:
+            assert _integrity_sha256(b"abc").hexdigest() == expected
+        sha256.assert_called_once_with(b"abc", usedforsecurity=False)
+
+    def test_checksum_large_file_streamed(self, tmp_path: Path) -> None:
+        """Files larger than the read buffer hash to the same digest as in memory."""
+        content = bytes(range(256)) * (4096 * 4 + 1)  # ~4 MiB, not buffer-aligned
+        path = tmp_path / "large.bin"
+        path.write_bytes(content)
+
+        assert verify_checksum(path, hashlib.sha256(content).hexdigest()) is True
+
+    def test_checksum_large_file_mmap_path(
+        self, hashed_file: tuple[Path, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files at or above the mmap threshold hash to the same result."""
+        monkeypatch.setattr("qtpilot.download._MMAP_THRESHOLD", 1)
+        path, digest = hashed_file
+        assert verify_checksum(path, digest) is True
+        assert verify_checksum(path, "0" * 64) is False
 
 
 class TestExtractArchive:
@@ -325,7 +470,7 @@ class TestExtractArchive:
         archive_path = tmp_path / "qtpilot-qt6.8-windows.zip"
         output_dir = tmp_path / "output"
 
-        with zipfile.ZipFile(archive_path, "w") as zf:
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED) as zf:
             zf.writestr("qtPilot-probe.dll", b"probe binary")
             zf.writestr("qtPilot-launcher.exe", b"launcher binary")
 
@@ -342,7 +487,8 @@ class TestExtractArchive:
         archive_path = tmp_path / "qtpilot-qt6.8-linux.tar.gz"
         output_dir = tmp_path / "output"
 
-        with tarfile.open(archive_path, "w:gz") as tf:
+        # extract_archive only accepts .tar.gz; level 1 keeps zlib cheap.
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tf:
             probe_data = b"probe binary"
             info = tarfile.TarInfo(name="qtPilot-probe.so")
             info.size = len(probe_data)
@@ -364,7 +510,7 @@ class TestExtractArchive:
         archive_path = tmp_path / "evil.zip"
         output_dir = tmp_path / "output"
 
-        with zipfile.ZipFile(archive_path, "w") as zf:
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED) as zf:
             zf.writestr("../../../etc/passwd", b"evil content")
 
         with pytest.raises(DownloadError, match="unsafe path"):
@@ -375,7 +521,7 @@ class TestExtractArchive:
         archive_path = tmp_path / "evil.tar.gz"
         output_dir = tmp_path / "output"
 
-        with tarfile.open(archive_path, "w:gz") as tf:
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tf:
             data = b"evil content"
             info = tarfile.TarInfo(name="../../../etc/passwd")
             info.size = len(data)
@@ -389,7 +535,7 @@ class TestExtractArchive:
         archive_path = tmp_path / "evil.tar.gz"
         output_dir = tmp_path / "output"
 
-        with tarfile.open(archive_path, "w:gz") as tf:
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as tf:
             info = tarfile.TarInfo(name="link")
             info.type = tarfile.SYMTYPE
             info.linkname = "/etc/passwd"
@@ -417,107 +563,165 @@ class TestExtractArchive:
             extract_archive(archive_path, output_dir)
 
 
+@pytest.mark.usefixtures("sys_platform")
+@pytest.mark.parametrize("sys_platform", ["win32"], indirect=True)
 class TestDownloadAndExtract:
     """Tests for the main download_and_extract function."""
 
-    def _make_zip(self, probe_data: bytes, launcher_data: bytes) -> bytes:
-        """Create an in-memory zip archive."""
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w") as zf:
-            zf.writestr("qtPilot-probe.dll", probe_data)
-            zf.writestr("qtPilot-launcher.exe", launcher_data)
-        return buf.getvalue()
-
-    def test_download_success_without_checksum(self, tmp_path: Path) -> None:
+    def test_download_success_without_checksum(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
         """Download succeeds without checksum verification."""
-        archive_data = self._make_zip(b"probe", b"launcher")
-
-        def mock_urlopen(url: str, timeout: int | None = None) -> io.BytesIO:
-            return io.BytesIO(archive_data)
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                probe, launcher = download_and_extract(
-                    "6.8",
-                    output_dir=tmp_path,
-                    verify=False,
-                    release_tag="v0.3.0",
-                )
+        fake_urlopen(serve(sample_zip.data))
+        probe, launcher = download_and_extract(
+            "6.8",
+            output_dir=tmp_path,
+            verify=False,
+            release_tag="v0.3.0",
+        )
 
         assert probe.exists()
         assert launcher.exists()
         assert probe.name == "qtPilot-probe.dll"
         assert launcher.name == "qtPilot-launcher.exe"
-        assert probe.read_bytes() == b"probe"
-        assert launcher.read_bytes() == b"launcher"
-
-    def test_download_with_checksum_verification(self, tmp_path: Path) -> None:
+        assert probe.read_bytes() == PROBE_CONTENT
+        assert launcher.read_bytes() == LAUNCHER_CONTENT
+
+    def test_download_with_checksum_verification(
+        self,
+        tmp_path: Path,
+        sample_zip: SampleZip,
+        fake_urlopen: FakeUrlopen,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Download verifies checksum when enabled."""
-        archive_data = self._make_zip(b"probe", b"launcher")
-        expected_hash = hashlib.sha256(archive_data).hexdigest()
-        checksums_content = f"{expected_hash}  qtpilot-qt6.8-windows-x64.zip\n"
-
-        call_count = {"count": 0}
-
-        def mock_urlopen(url: str, timeout: int | None = None) -> io.BytesIO:
-            call_count["count"] += 1
-            if "SHA256SUMS" in url:
-                return io.BytesIO(checksums_content.encode())
-            return io.BytesIO(archive_data)
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                probe, launcher = download_and_extract(
-                    "6.8",
-                    output_dir=tmp_path,
-                    verify=True,
-                    release_tag="v0.3.0",
-                )
+        checksums_data = f"{sample_zip.sha256}  qtpilot-qt6.8-windows-x64.zip\n".encode()
+
+        def no_reread(filepath: Path, expected_hash: str) -> bool:
+            raise AssertionError("archive should be hashed while downloading")
+
+        urls = fake_urlopen(serve(sample_zip.data, checksums_data))
+        monkeypatch.setattr("qtpilot.download.verify_checksum", no_reread)
+        probe, launcher = download_and_extract(
+            "6.8",
+            output_dir=tmp_path,
+            verify=True,
+            release_tag="v0.3.0",
+        )
 
         assert probe.exists()
         assert launcher.exists()
-        assert call_count["count"] == 2  # SHA256SUMS + archive
+        assert len(urls) == 2  # SHA256SUMS + archive
+
+    def test_checksums_fetched_while_archive_downloads(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
+        """SHA256SUMS is requested concurrently with, not before, the archive."""
+        checksums_data = f"{sample_zip.sha256}  qtpilot-qt6.8-windows-x64.zip\n".encode()
+        archive_requested = threading.Event()
+
+        def handler(url: str) -> BinaryIO:
+            if url.endswith("/SHA256SUMS"):
+                # Serial code would block here until the timeout
+                assert archive_requested.wait(timeout=5)
+                return io.BytesIO(checksums_data)
+            archive_requested.set()
+            return io.BytesIO(sample_zip.data)
+
+        fake_urlopen(handler)
+        probe, _ = download_and_extract(
+            "6.8",
+            output_dir=tmp_path,
+            verify=True,
+            release_tag="v0.3.0",
+        )
 
-    def test_download_checksum_mismatch_raises(self, tmp_path: Path) -> None:
+        assert probe.read_bytes() == PROBE_CONTENT
+
+    def test_no_checksum_worker_without_verify(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
+        """With verify=False no background checksum fetch is started."""
+        fake_urlopen(serve(sample_zip.data))
+        with mock.patch("qtpilot.download._fetch_checksums_in_background") as fetch:
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=False,
+                release_tag="v0.3.0",
+            )
+
+        fetch.assert_not_called()
+
+    def test_missing_checksums_abort_archive_download(
+        self, tmp_path: Path, fake_urlopen: FakeUrlopen
+    ) -> None:
+        """A 404 for SHA256SUMS stops the archive download instead of finishing it."""
+        max_reads = 5000
+        reads = 0
+        fetch_threads: list[threading.Thread] = []
+
+        class EndlessArchive(io.RawIOBase):
+            def readinto(self, buf) -> int:
+                nonlocal reads
+                reads += 1
+                if reads >= max_reads:
+                    return 0
+                time.sleep(0.001)
+                buf[0] = 0
+                return 1
+
+        def handler(url: str) -> BinaryIO:
+            if url.endswith("/SHA256SUMS"):
+                fetch_threads.append(threading.current_thread())
+                raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+            return EndlessArchive()
+
+        fake_urlopen(handler)
+        with pytest.raises(DownloadError, match="SHA256SUMS not found"):
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=True,
+                release_tag="v0.3.0",
+            )
+
+        assert reads < max_reads
+        assert fetch_threads[0].daemon  # never holds up interpreter exit
+        assert not (tmp_path / "qtpilot-qt6.8-windows-x64.zip.part").exists()
+
+    def test_download_checksum_mismatch_raises(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
         """Checksum mismatch should raise ChecksumError."""
-        archive_data = self._make_zip(b"probe", b"launcher")
         wrong_hash = "0" * 64
-        checksums_content = f"{wrong_hash}  qtpilot-qt6.8-windows-x64.zip\n"
-
-        def mock_urlopen(url: str, timeout: int | None = None) -> io.BytesIO:
-            if "SHA256SUMS" in url:
-                return io.BytesIO(checksums_content.encode())
-            return io.BytesIO(archive_data)
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                with pytest.raises(ChecksumError) as exc_info:
-                    download_and_extract(
-                        "6.8",
-                        output_dir=tmp_path,
-                        verify=True,
-                        release_tag="v0.3.0",
-                    )
+        checksums_data = f"{wrong_hash}  qtpilot-qt6.8-windows-x64.zip\n".encode()
+
+        fake_urlopen(serve(sample_zip.data, checksums_data))
+        with pytest.raises(ChecksumError) as exc_info:
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=True,
+                release_tag="v0.3.0",
+            )
 
         assert "verification failed" in str(exc_info.value)
-        # Archive should be cleaned up
+        # Neither the archive nor its partial download should be left behind
         assert not (tmp_path / "qtpilot-qt6.8-windows-x64.zip").exists()
+        assert not (tmp_path / "qtpilot-qt6.8-windows-x64.zip.part").exists()
 
-    def test_archive_cleaned_up_after_extraction(self, tmp_path: Path) -> None:
+    def test_archive_cleaned_up_after_extraction(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
         """Archive file should be deleted after successful extraction."""
-        archive_data = self._make_zip(b"probe", b"launcher")
-
-        def mock_urlopen(url: str, timeout: int | None = None) -> io.BytesIO:
-            return io.BytesIO(archive_data)
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                download_and_extract(
-                    "6.8",
-                    output_dir=tmp_path,
-                    verify=False,
-                    release_tag="v0.3.0",
-                )
+        fake_urlopen(serve(sample_zip.data))
+        download_and_extract(
+            "6.8",
+            output_dir=tmp_path,
+            verify=False,
+            release_tag="v0.3.0",
+        )
 
         # Archive should be cleaned up
         assert not (tmp_path / "qtpilot-qt6.8-windows-x64.zip").exists()
@@ -525,55 +729,86 @@ class TestDownloadAndExtract:
         assert (tmp_path / "qtPilot-probe.dll").exists()
         assert (tmp_path / "qtPilot-launcher.exe").exists()
 
+    def test_download_many_fetches_checksums_once(
+        self, tmp_path: Path, sample_zip: SampleZip, fake_urlopen: FakeUrlopen
+    ) -> None:
+        """Bulk download shares one SHA256SUMS fetch across all versions."""
+        checksums_data = "".join(
+            f"{sample_zip.sha256}  qtpilot-qt{v}-windows-x64.zip\n" for v in ("5.15", "6.8")
+        ).encode()
+
+        urls = fake_urlopen(serve(sample_zip.data, checksums_data))
+        results = download_many(["5.15", "6.8.1", "6.8"], output_dir=tmp_path, release_tag="v0.3.0")
+
+        assert list(results) == ["5.15", "6.8"]
+        for version, (probe, launcher) in results.items():
+            assert probe == tmp_path / version / "qtPilot-probe.dll"
+            assert probe.read_bytes() == PROBE_CONTENT
+            assert launcher.read_bytes() == LAUNCHER_CONTENT
+        assert sum("SHA256SUMS" in url for url in urls) == 1
+        assert len(urls) == 3  # SHA256SUMS + one archive per distinct version
 
+
+@pytest.mark.usefixtures("sys_platform")
+@pytest.mark.parametrize("sys_platform", ["win32"], indirect=True)
 class TestErrorHandling:
     """Tests for error handling."""
 
-    def test_404_error_handling(self, tmp_path: Path) -> None:
+    def test_404_error_handling(self, tmp_path: Path, fake_urlopen: FakeUrlopen) -> None:
         """HTTP 404 should raise DownloadError."""
-        def mock_urlopen(url: str, timeout: int | None = None) -> None:
-            raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                with pytest.raises(DownloadError) as exc_info:
-                    download_and_extract(
-                        "6.8",
-                        output_dir=tmp_path,
-                        verify=True,
-                        release_tag="v0.3.0",
-                    )
+        fake_urlopen(fail_with(urllib.error.HTTPError("", 404, "Not Found", {}, None)))
+        with pytest.raises(DownloadError) as exc_info:
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=True,
+                release_tag="v0.3.0",
+            )
 
         assert "not found" in str(exc_info.value).lower()
 
-    def test_network_error_handling(self, tmp_path: Path) -> None:
+    def test_network_error_handling(self, tmp_path: Path, fake_urlopen: FakeUrlopen) -> None:
         """Network errors should raise DownloadError."""
-        def mock_urlopen(url: str, timeout: int | None = None) -> None:
-            raise urllib.error.URLError("Connection refused")
-
-        with mock.patch("qtpilot.download.sys.platform", "win32"):
-            with mock.patch("qtpilot.download.urllib.request.urlopen", mock_urlopen):
-                with pytest.raises(DownloadError) as exc_info:
-                    download_and_extract(
-                        "6.8",
-                        output_dir=tmp_path,
-                        verify=True,
-                        release_tag="v0.3.0",
-                    )
+        fake_urlopen(fail_with(urllib.error.URLError("Connection refused")))
+        with pytest.raises(DownloadError) as exc_info:
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=True,
+                release_tag="v0.3.0",
+            )
 
         assert "network error" in str(exc_info.value).lower()
 
+    def test_interrupted_download_leaves_no_files(
+        self, tmp_path: Path, fake_urlopen: FakeUrlopen
+    ) -> None:
+        """A connection dropped mid-stream should not leave a partial archive."""
+        class DroppedResponse(io.BytesIO):
+            def readinto(self, buffer) -> int:
+                if self.tell():
+                    raise urllib.error.URLError("Connection reset")
+                return super().readinto(buffer)
+
+        fake_urlopen(lambda url: DroppedResponse(b"partial archive"))
+        with pytest.raises(DownloadError):
+            download_and_extract(
+                "6.8",
+                output_dir=tmp_path,
+                verify=False,
+                release_tag="v0.3.0",
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestAvailableVersions:
     """Tests for available versions constant."""
 
-    def test_expected_versions_available(self) -> None:
+    @pytest.mark.parametrize("version", ["5.15", "5.15-patched", "6.5", "6.8", "6.9"])
+    def test_expected_versions_available(self, version: str) -> None:
         """All expected Qt versions should be available."""
-        assert "5.15" in AVAILABLE_VERSIONS
-        assert "5.15-patched" in AVAILABLE_VERSIONS
-        assert "6.5" in AVAILABLE_VERSIONS
-        assert "6.8" in AVAILABLE_VERSIONS
-        assert "6.9" in AVAILABLE_VERSIONS
+        assert version in AVAILABLE_VERSIONS
 
     def test_versions_is_frozen(self) -> None:
         """AVAILABLE_VERSIONS should be immutable."""
@@ -16,17 +16,16 @@ from qtpilot.event_recorder import (
     EventRecorder,
     RecordedEvent,
     TargetSpec,
+    _default_signals,
 )
 
 
-pytestmark = pytest.mark.asyncio
-
-
 # ---------------------------------------------------------------------------
 # Phase 1: Notification routing in ProbeConnection
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio
 class TestNotificationRouting:
     async def test_handler_receives_signal_notification(self, mock_probe):
         """Notification with method field is routed to the handler."""
@@ -40,8 +39,8 @@ class TestNotificationRouting:
             "method": "qtpilot.signalEmitted",
             "params": {"objectId": "btn", "signal": "clicked"},
         })
-        # Give the recv loop time to process
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         assert len(received) == 1
         assert received[0][0] == "qtpilot.signalEmitted"
@@ -59,7 +58,8 @@ class TestNotificationRouting:
             "method": "qtpilot.objectCreated",
             "params": {"objectId": "dialog", "className": "QDialog"},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         assert len(received) == 1
         assert received[0][0] == "qtpilot.objectCreated"
@@ -73,7 +73,8 @@ class TestNotificationRouting:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         # No crash = pass
 
     async def test_handler_exception_does_not_crash_recv_loop(self, mock_probe):
@@ -90,7 +91,8 @@ class TestNotificationRouting:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
 
         # Recv loop should still be alive -- verify by doing a normal call
         mock_ws.responses[probe._next_id] = {
@@ -114,7 +116,8 @@ class TestNotificationRouting:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 1
 
         probe.remove_notification_handler(received_handler)
@@ -124,7 +127,8 @@ class TestNotificationRouting:
             "method": "qtpilot.signalEmitted",
             "params": {},
         })
-        await asyncio.sleep(0.1)
+        await mock_ws.drain()
+        await probe.wait_idle()
         assert len(received) == 1  # no new events
 
 
@@ -133,6 +137,7 @@ class TestNotificationRouting:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio
 class TestEventRecorder:
     async def test_start_stop_basic(self, mock_probe):
         """Start and stop recording with a target."""
@@ -170,6 +175,73 @@ class TestEventRecorder:
         assert result["subscriptions"] == 2  # clicked + toggled
         assert recorder.is_recording is True
 
+    async def test_start_pipelines_subscriptions(self, mock_probe):
+        """All subscriptions are sent before any response is awaited; failures are skipped."""
+        probe, mock_ws = mock_probe
+        recorder = EventRecorder()
+
+        base = probe._next_id
+        for i, sub_id in enumerate(["sub_0", None, "sub_2"]):
+            if sub_id is None:
+                mock_ws.responses[base + i] = {
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32000, "message": "No such signal"},
+                    "id": base + i,
+                }
+            else:
+                mock_ws.responses[base + i] = {
+                    "jsonrpc": "2.0",
+                    "result": {"meta": {}, "result": {"subscriptionId": sub_id}},
+                    "id": base + i,
+                }
+
+        result = await recorder.start(
+            probe,
+            [TargetSpec("btn", signals=["clicked"]), TargetSpec("chk", signals=["bogus", "toggled"])],
+            include_lifecycle=False,
+        )
+
+        sent = [json.loads(m)["params"] for m in mock_ws.sent_messages]
+        assert sent == [
+            {"objectId": "btn", "signal": "clicked"},
+            {"objectId": "chk", "signal": "bogus"},
+            {"objectId": "chk", "signal": "toggled"},
+        ]
+        assert result["subscriptions"] == 2
+        assert recorder._subscriptions == ["sub_0", "sub_2"]
+
+    async def test_max_events_keeps_most_recent(self, mock_probe):
+        """With max_events set, older events are discarded as new ones arrive."""
+        probe, mock_ws = mock_probe
+        recorder = EventRecorder()
+
+        await recorder.start(probe, [], include_lifecycle=False, max_events=2)
+        for i in range(3):
+            recorder._handle_notification("qtpilot.signalEmitted", {
+                "objectId": f"btn{i}", "signal": "clicked",
+            })
+        result = await recorder.stop(probe)
+
+        assert [e["object"] for e in result["events"]] == ["btn1", "btn2"]
+
+    @pytest.mark.parametrize("max_events", [0, -1])
+    async def test_max_events_below_one_rejected(self, mock_probe, max_events):
+        """An invalid max_events raises before the running session is touched."""
+        probe, mock_ws = mock_probe
+        recorder = EventRecorder()
+        await recorder.start(probe, [], include_lifecycle=False)
+        recorder._handle_notification("qtpilot.signalEmitted", {
+            "objectId": "btn", "signal": "clicked",
+        })
+        sent = len(mock_ws.sent_messages)
+
+        with pytest.raises(ValueError, match="max_events"):
+            await recorder.start(probe, [], include_lifecycle=False, max_events=max_events)
+
+        assert recorder.is_recording is True
+        assert len(recorder._events) == 1
+        assert len(mock_ws.sent_messages) == sent
+
     async def test_stop_without_start(self, mock_probe):
         """Stopping when not recording returns empty result."""
         probe, mock_ws = mock_probe
@@ -181,6 +253,27 @@ class TestEventRecorder:
         assert result["event_count"] == 0
         assert result["events"] == []
 
+    async def test_stop_converts_large_buffer_off_loop(self, mock_probe, monkeypatch):
+        """Large recordings are converted in a worker thread with the same output."""
+        import qtpilot.event_recorder as event_recorder
+
+        monkeypatch.setattr(event_recorder, "_OFFLOAD_MIN_EVENTS", 3)
+        probe, mock_ws = mock_probe
+        recorder = EventRecorder()
+        recorder._recording = True
+        recorder._start_ns = time.monotonic_ns()
+        recorder._include_lifecycle = False
+        for i in range(3):
+            recorder._handle_notification("qtpilot.signalEmitted", {
+                "objectId": f"btn{i}", "signal": "clicked",
+            })
+
+        result = await recorder.stop(probe)
+
+        assert result["event_count"] == 3
+        assert [e["object"] for e in result["events"]] == ["btn0", "btn1", "btn2"]
+        assert recorder.event_count == 0
+
     async def test_status_not_recording(self):
         """Status when idle."""
         recorder = EventRecorder()
@@ -188,11 +281,35 @@ class TestEventRecorder:
         assert status["recording"] is False
         assert status["event_count"] == 0
 
+    async def test_status_tracks_new_events(self):
+        """Status reflects events appended since the last call."""
+        recorder = EventRecorder()
+        recorder._recording = True
+        recorder._start_ns = time.monotonic_ns()
+        recorder._include_lifecycle = False
+
+        assert recorder.status()["event_count"] == 0
+        recorder._handle_notification("qtpilot.signalEmitted", {
+            "objectId": "btn", "signal": "clicked",
+        })
+        status = recorder.status()
+        assert status["event_count"] == 1
+        assert "duration" in status
+
+        recorder._recording = False
+        assert recorder.status() == {"recording": False, "event_count": 1}
+
+    async def test_status_returns_fresh_dict(self):
+        """Mutating one status result does not leak into later calls."""
+        recorder = EventRecorder()
+        recorder.status()["x"] = 1
+        assert recorder.status() == {"recording": False, "event_count": 0}
+
     async def test_event_capture(self):
         """Notification handler captures events with correct timestamps."""
         recorder = EventRecorder()
         recorder._recording = True
-        recorder._start_time = time.monotonic() - 1.0  # started 1 second ago
+        recorder._start_ns = time.monotonic_ns() - 1_000_000_000  # started 1s ago
         recorder._subscriptions = ["sub_1"]
         recorder._include_lifecycle = True
 
@@ -210,13 +327,29 @@ class TestEventRecorder:
         assert event.object_id == "MainWindow/QPushButton#okBtn"
         assert event.object_name == "okBtn"
         assert event.detail == "clicked"
-        assert event.timestamp >= 1.0  # at least 1 second since start
+        assert event.timestamp >= 1000  # at least 1 second since start, in ms
+
+    async def test_signal_without_arguments_shares_empty_default(self):
+        """Argument-less signals reuse one empty tuple rather than new lists."""
+        recorder = EventRecorder()
+        recorder._recording = True
+        recorder._start_ns = time.monotonic_ns()
+
+        for _ in range(2):
+            recorder._handle_notification("qtpilot.signalEmitted", {
+                "objectId": "btn", "signal": "clicked",
+            })
+
+        first, second = recorder._events
+        assert first.arguments == ()
+        assert first.arguments is second.arguments
+        assert first.to_dict()["args"] == []  # a list, like other signals
 
     async def test_event_capture_lifecycle(self):
         """Lifecycle notifications are captured."""
         recorder = EventRecorder()
         recorder._recording = True
-        recorder._start_time = time.monotonic()
+        recorder._start_ns = time.monotonic_ns()
         recorder._subscriptions = []
         recorder._include_lifecycle = True
 
@@ -239,7 +372,7 @@ class TestEventRecorder:
         """Notifications from any subscription are captured."""
         recorder = EventRecorder()
         recorder._recording = True
-        recorder._start_time = time.monotonic()
+        recorder._start_ns = time.monotonic_ns()
         recorder._subscriptions = ["sub_1"]
         recorder._include_lifecycle = False
 
@@ -255,7 +388,7 @@ class TestEventRecorder:
         """Lifecycle events are not captured when include_lifecycle=False."""
         recorder = EventRecorder()
         recorder._recording = True
-        recorder._start_time = time.monotonic()
+        recorder._start_ns = time.monotonic_ns()
         recorder._subscriptions = []
         recorder._include_lifecycle = False
 
@@ -266,6 +399,17 @@ class TestEventRecorder:
 
         assert recorder.event_count == 0
 
+    async def test_unknown_notification_ignored(self):
+        """Notifications without a recorder, e.g. objectDestroyed, add no events."""
+        recorder = EventRecorder()
+        recorder._recording = True
+        recorder._start_ns = time.monotonic_ns()
+
+        recorder._handle_notification("qtpilot.objectDestroyed", {"objectId": "obj"})
+        recorder._handle_notification("qtpilot.somethingElse", {"objectId": "obj"})
+
+        assert recorder.event_count == 0
+
     async def test_not_recording_ignores(self):
         """Handler does nothing when not recording."""
         recorder = EventRecorder()
@@ -284,7 +428,7 @@ class TestRecordedEvent:
     def test_signal_to_dict(self):
         """Signal event serializes with signal-specific fields."""
         event = RecordedEvent(
-            timestamp=1.234,
+            timestamp=1234,
             event_type="signal",
             object_id="MainWindow/QPushButton#okBtn",
             object_name="okBtn",
@@ -304,7 +448,7 @@ class TestRecordedEvent:
     def test_created_to_dict(self):
         """Object created event serializes with class field."""
         event = RecordedEvent(
-            timestamp=2.0,
+            timestamp=2000,
             event_type="object_created",
             object_id="MainWindow/QDialog#dlg",
             object_name="dlg",
@@ -322,7 +466,7 @@ class TestRecordedEvent:
     def test_destroyed_to_dict_no_name(self):
         """Destroyed event without objectName omits the name field."""
         event = RecordedEvent(
-            timestamp=3.5,
+            timestamp=3500,
             event_type="object_destroyed",
             object_id="MainWindow/QObject~42",
         )
@@ -334,16 +478,23 @@ class TestRecordedEvent:
         }
         assert "name" not in d
 
-    def test_timestamp_rounded(self):
-        """Timestamp is rounded to 3 decimal places."""
-        event = RecordedEvent(
-            timestamp=1.23456789,
-            event_type="signal",
-            object_id="btn",
-            detail="clicked",
+    @pytest.mark.parametrize(("elapsed_ns", "t"), [
+        (1_234_499_999, 1.234),
+        (1_234_500_000, 1.235),  # half a millisecond rounds up
+    ])
+    def test_timestamp_rounded(self, elapsed_ns, t):
+        """Timestamps round to the nearest millisecond and export in seconds."""
+        recorder = EventRecorder()
+        recorder._recording = True
+        recorder._start_ns = 10_000_000_000
+
+        recorder._handle_notification(
+            "qtpilot.signalEmitted",
+            {"objectId": "btn", "signal": "clicked"},
+            _clock=lambda: recorder._start_ns + elapsed_ns,
         )
-        d = event.to_dict()
-        assert d["t"] == 1.235
+
+        assert recorder._events[0].to_dict()["t"] == t
 
 
 class TestSmartSignals:
@@ -359,3 +510,34 @@ class TestSmartSignals:
         assert "clicked" in FALLBACK_SIGNALS
         assert "toggled" in FALLBACK_SIGNALS
         assert "triggered" in FALLBACK_SIGNALS
+
+    def test_default_signals_by_class(self):
+        """Defaults come from the exact class, a matching suffix, or the fallback."""
+        def inspect(class_name):
+            return {"result": {"info": {"className": class_name}}}
+
+        assert _default_signals(inspect("QSlider")) == INTERACTIVE_SIGNALS["QSlider"]
+        assert _default_signals(inspect("PushButton")) == INTERACTIVE_SIGNALS["QPushButton"]
+        assert _default_signals(inspect("QGraphicsView")) == FALLBACK_SIGNALS
+        assert _default_signals(RuntimeError("inspect failed")) == FALLBACK_SIGNALS
+        assert _default_signals(asyncio.CancelledError()) == FALLBACK_SIGNALS
+
+    def test_signal_table_is_read_only(self):
+        """The defaults table can't change under the per-class cache."""
+        with pytest.raises(TypeError):
+            INTERACTIVE_SIGNALS["QWidget"] = ("clicked",)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_child_lookup_skipped(self, mock_probe, monkeypatch):
+        """A cancelled call_many outcome is treated as a failure, not a response."""
+        probe, _ = mock_probe
+
+        async def call_many(calls):
+            return [asyncio.CancelledError() for _ in calls]
+
+        monkeypatch.setattr(probe, "call_many", call_many)
+        result = await EventRecorder().start(
+            probe, [TargetSpec("root", recursive=True)], include_lifecycle=False,
+        )
+
+        assert result["subscriptions"] == 0
@@ -31,3 +31,31 @@ class TestRecordingTools:
         }
         missing = expected - names
         assert not missing, f"Missing recording tools: {missing}"
+
+    @pytest.mark.asyncio
+    async def test_start_passes_max_events(self, mock_mcp, monkeypatch):
+        """qtpilot_recording_start forwards max_events to the recorder."""
+        from qtpilot.tools import recording_tools
+
+        seen = {}
+
+        class FakeRecorder:
+            async def start(self, probe, specs, **kwargs):
+                seen.update(kwargs)
+                return {"recording": True}
+
+        monkeypatch.setattr(recording_tools, "require_probe", lambda: object())
+        monkeypatch.setattr(recording_tools, "get_recorder", lambda: FakeRecorder())
+        register_recording_tools(mock_mcp)
+        start = mock_mcp._tool_manager._tools["qtpilot_recording_start"].fn
+
+        await start(targets=[{"object_id": "MainWindow"}], max_events=500)
+
+        assert seen["max_events"] == 500
+
+    def test_start_schema_requires_positive_max_events(self, mock_mcp):
+        """The tool schema rejects max_events below 1 before the recorder runs."""
+        register_recording_tools(mock_mcp)
+        tool = mock_mcp._tool_manager._tools["qtpilot_recording_start"]
+        schema = tool.parameters["properties"]["max_events"]
+        assert {"type": "integer", "minimum": 1} in schema["anyOf"]
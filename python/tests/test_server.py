@@ -0,0 +1,26 @@
+"""Unit tests for server helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from qtpilot.server import _resolve_launcher
+
+
+class TestResolveLauncher:
+    """Tests for resolving the launcher before it is spawned."""
+
+    def test_existing_path_is_returned(self, tmp_path: Path):
+        """A launcher path that exists resolves to itself."""
+        launcher = tmp_path / "qtPilot-launcher"
+        launcher.touch()
+        assert _resolve_launcher(str(launcher)) == str(launcher)
+
+    def test_missing_path_returns_none(self, tmp_path: Path):
+        """A launcher path that does not exist resolves to None."""
+        assert _resolve_launcher(str(tmp_path / "qtPilot-launcher")) is None
+
+    def test_bare_name_not_on_path_returns_none(self, monkeypatch, tmp_path: Path):
+        """A bare launcher name is looked up on PATH."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert _resolve_launcher("qtPilot-launcher-missing") is None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
+
 import pytest
 
 from fastmcp import FastMCP
@@ -12,107 +15,208 @@ from qtpilot.tools.chrome import register_chrome_tools
 from qtpilot.tools.discovery_tools import register_discovery_tools
 
 
+# Key tool names each register_* function must provide.
+_EXPECTED_NATIVE = frozenset({
+    "qt_ping",
+    "qt_objects_search",
+    "qt_objects_tree",
+    "qt_objects_inspect",
+    "qt_properties_get",
+    "qt_properties_set",
+    "qt_methods_invoke",
+    "qt_signals_subscribe",
+    "qt_ui_click",
+    "qt_ui_screenshot",
+    "qt_ui_sendKeys",
+    "qt_ui_clickItem",
+    "qt_models_list",
+    "qt_models_data",
+    "qt_models_search",
+    "qt_names_register",
+    "qt_names_list",
+})
+
+_EXPECTED_CU = frozenset({
+    "cu_screenshot",
+    "cu_leftClick",
+    "cu_rightClick",
+    "cu_doubleClick",
+    "cu_type",
+    "cu_key",
+    "cu_scroll",
+    "cu_cursorPosition",
+    "cu_mouseMove",
+    "cu_mouseDrag",
+    "cu_mouseDown",
+    "cu_mouseUp",
+    "cu_middleClick",
+})
+
+_EXPECTED_DISCOVERY = frozenset({
+    "qtpilot_status",
+    "qtpilot_connect_probe",
+    "qtpilot_disconnect_probe",
+    "qtpilot_set_mode",
+})
+
+_EXPECTED_CHROME = frozenset({
+    "chr_readPage",
+    "chr_click",
+    "chr_find",
+    "chr_formInput",
+    "chr_getPageText",
+    "chr_navigate",
+    "chr_tabsContext",
+    "chr_readConsoleMessages",
+})
+
+
 def _tool_names(mcp: FastMCP) -> set[str]:
     """Extract registered tool names from a FastMCP instance."""
     return set(mcp._tool_manager._tools.keys())
 
 
+@functools.cache
+def _registered_names(register: Callable[[FastMCP], None]) -> frozenset[str]:
+    """Tool names one register_* function adds to a fresh server.
+
+    Registration builds and validates every tool schema, so each tool set is
+    registered once per run and shared by the read-only name checks below.
+    """
+    mcp = FastMCP("test")
+    register(mcp)
+    return frozenset(_tool_names(mcp))
+
+
 class TestNativeTools:
-    def test_native_tools_registered(self, mock_mcp):
+    def test_native_tools_registered(self):
         """Native mode registers >= 25 tools."""
-        register_native_tools(mock_mcp)
-        assert len(_tool_names(mock_mcp)) >= 25
+        assert len(_registered_names(register_native_tools)) >= 25
 
-    def test_native_tool_names(self, mock_mcp):
+    def test_native_tool_names(self):
         """Key native tool names are present."""
-        register_native_tools(mock_mcp)
-        names = _tool_names(mock_mcp)
-        expected = {
-            "qt_ping",
-            "qt_objects_search",
-            "qt_objects_tree",
-            "qt_objects_inspect",
-            "qt_properties_get",
-            "qt_properties_set",
-            "qt_methods_invoke",
-            "qt_signals_subscribe",
-            "qt_ui_click",
-            "qt_ui_screenshot",
-            "qt_ui_sendKeys",
-            "qt_ui_clickItem",
-            "qt_models_list",
-            "qt_models_data",
-            "qt_models_search",
-            "qt_names_register",
-            "qt_names_list",
-        }
-        missing = expected - names
+        names = _registered_names(register_native_tools)
+        missing = _EXPECTED_NATIVE - names
         assert not missing, f"Missing native tools: {missing}"
 
 
 class TestCuTools:
-    def test_cu_tools_registered(self, mock_mcp):
+    def test_cu_tools_registered(self):
         """Computer Use mode registers exactly 13 tools."""
-        register_cu_tools(mock_mcp)
-        assert len(_tool_names(mock_mcp)) == 13
+        assert len(_registered_names(register_cu_tools)) == 13
 
-    def test_cu_tool_names(self, mock_mcp):
+    def test_cu_tool_names(self):
         """Key CU tool names are present."""
-        register_cu_tools(mock_mcp)
-        names = _tool_names(mock_mcp)
-        expected = {
-            "cu_screenshot",
-            "cu_leftClick",
-            "cu_rightClick",
-            "cu_doubleClick",
-            "cu_type",
-            "cu_key",
-            "cu_scroll",
-            "cu_cursorPosition",
-            "cu_mouseMove",
-            "cu_mouseDrag",
-            "cu_mouseDown",
-            "cu_mouseUp",
-            "cu_middleClick",
-        }
-        missing = expected - names
+        names = _registered_names(register_cu_tools)
+        missing = _EXPECTED_CU - names
         assert not missing, f"Missing CU tools: {missing}"
 
 
 class TestDiscoveryTools:
-    def test_discovery_tool_names(self, mock_mcp):
+    def test_discovery_tool_names(self):
         """Discovery-layer tools include the unified qtpilot_status."""
-        register_discovery_tools(mock_mcp)
-        names = _tool_names(mock_mcp)
-        expected = {
-            "qtpilot_status",
-            "qtpilot_connect_probe",
-            "qtpilot_disconnect_probe",
-            "qtpilot_set_mode",
-        }
-        missing = expected - names
+        names = _registered_names(register_discovery_tools)
+        missing = _EXPECTED_DISCOVERY - names
         assert not missing, f"Missing discovery tools: {missing}"
 
 
 class TestChromeTools:
-    def test_chrome_tools_registered(self, mock_mcp):
+    def test_chrome_tools_registered(self):
         """Chrome mode registers exactly 8 tools."""
-        register_chrome_tools(mock_mcp)
-        assert len(_tool_names(mock_mcp)) == 8
+        assert len(_registered_names(register_chrome_tools)) == 8
 
-    def test_chrome_tool_names(self, mock_mcp):
+    def test_chrome_tool_names(self):
         """Key Chrome tool names are present."""
+        names = _registered_names(register_chrome_tools)
+        missing = _EXPECTED_CHROME - names
+        assert not missing, f"Missing Chrome tools: {missing}"
+
+
+class TestForwarder:
+    @pytest.mark.asyncio
+    async def test_none_args_omitted_and_defaults_sent(self, monkeypatch):
+        """Forwarders drop None arguments and always send non-None defaults."""
+        from qtpilot.tools import _forward
+        from qtpilot.tools._forward import Arg, ToolSpec, make_forwarder
+
+        calls = []
+
+        class FakeProbe:
+            async def call(self, method, params=None):
+                calls.append((method, params))
+                return {}
+
+        monkeypatch.setattr(_forward, "require_probe", lambda: FakeProbe())
+        fn = make_forwarder(ToolSpec(
+            "t_tool", "t.method", "Doc.",
+            (Arg("ref", str), Arg("action", str, "go"), Arg("limit", int | None, None)),
+        ))
+
+        await fn(ref="r1")
+        assert calls == [("t.method", {"ref": "r1", "action": "go"})]
+
+    def test_signature_visible_to_fastmcp(self, mock_mcp):
+        """FastMCP sees the declared parameters, not **kwargs."""
         register_chrome_tools(mock_mcp)
-        names = _tool_names(mock_mcp)
-        expected = {
-            "chr_readPage",
-            "chr_click",
-            "chr_find",
-            "chr_formInput",
-            "chr_getPageText",
-            "chr_navigate",
-            "chr_tabsContext",
-            "chr_readConsoleMessages",
+        schema = mock_mcp._tool_manager._tools["chr_navigate"].parameters
+        assert schema["required"] == ["ref"]
+        assert schema["properties"]["action"]["default"] == "activateTab"
+
+
+class TestBatch:
+    """qt_batch pipelines calls and reports each outcome in its own slot."""
+
+    @pytest.fixture
+    def qt_batch(self, mock_mcp, mock_probe, monkeypatch):
+        from qtpilot.tools import native
+
+        probe, _ = mock_probe
+        monkeypatch.setattr(native, "require_probe", lambda: probe)
+        register_native_tools(mock_mcp)
+        return mock_mcp._tool_manager._tools["qt_batch"].fn
+
+    @pytest.mark.asyncio
+    async def test_mixed_results_in_call_order(self, qt_batch, mock_probe):
+        """Probe errors fill their own slot; results keep the order of calls."""
+        probe, mock_ws = mock_probe
+        base = probe._next_id
+        mock_ws.responses[base] = {"jsonrpc": "2.0", "result": {"n": 0}, "id": base}
+        mock_ws.responses[base + 1] = {
+            "jsonrpc": "2.0", "error": {"code": -32001, "message": "No object"}, "id": base + 1,
         }
-        missing = expected - names
-        assert not missing, f"Missing Chrome tools: {missing}"
+        mock_ws.responses[base + 2] = {"jsonrpc": "2.0", "result": {"n": 2}, "id": base + 2}
+
+        result = await qt_batch(calls=[
+            {"method": "qt.ping"},
+            {"method": "qt.objects.inspect", "params": {"objectId": "gone"}},
+            {"method": "qt.version"},
+        ])
+
+        assert result == {"results": [
+            {"result": {"n": 0}},
+            {"error": {"code": -32001, "message": "No object"}},
+            {"result": {"n": 2}},
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_other_exceptions_reported_per_entry(self, qt_batch, mock_probe, monkeypatch):
+        """A non-probe failure is reported in its slot; other results survive."""
+        probe, _ = mock_probe
+
+        async def call_many(calls):
+            return [{"ok": True}, ConnectionError("WebSocket closed")]
+
+        monkeypatch.setattr(probe, "call_many", call_many)
+        result = await qt_batch(calls=[{"method": "qt.ping"}, {"method": "qt.ping"}])
+
+        assert result["results"][0] == {"result": {"ok": True}}
+        assert result["results"][1]["error"]["message"] == "ConnectionError: WebSocket closed"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("entry", ["qt.ping", {"params": {}}, {"method": "chr.tabs"}])
+    async def test_invalid_entry_rejected(self, qt_batch, mock_probe, entry):
+        """Malformed entries fail before anything is sent."""
+        _, mock_ws = mock_probe
+        with pytest.raises(ValueError, match=r"calls\[0\]"):
+            await qt_batch(calls=[entry])
+        assert mock_ws.sent_messages == []
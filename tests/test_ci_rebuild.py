@@ -8,31 +8,132 @@ new CI workflows written, and configuration is consistent.
 Run with: python -m pytest tests/test_ci_rebuild.py -v
 """
 
+import functools
 import json
 import os
 import re
 
 import pytest
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses the same files
+    _loads = json.loads
+
 # Project root is one level up from tests/
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Qt version entries in the ci.yml build matrix, e.g. qt: "6.8.0"
+_QT_VERSION_RE = re.compile(r'qt:\s*"?([0-9]+\.[0-9]+\.[0-9]+)"?')
+
+# User-facing presets expected in every CMakePresets.json section
+_EXPECTED_PRESETS = frozenset({"debug", "release", "windows-debug", "windows-release"})
+
+# Whole-word test target names in tests/CMakeLists.txt, e.g. test_jsonrpc
+_TEST_NAME_RE = re.compile(r"\btest_\w+")
+
 
+@functools.cache
 def read_file(relpath):
-    """Read a file relative to project root. Returns None if not found."""
+    """Read a file relative to project root. Returns None if not found.
+
+    Cached: the same few build/CI files are checked by many tests, and none
+    of them change during a run.
+    """
     path = os.path.join(ROOT, relpath)
-    if not os.path.exists(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+
+
+# Directories listed once per run; existence checks inside them are set
+# lookups instead of a stat() each.
+_SCANNED_DIRS = ("", ".github", ".github/workflows")
+
+
+@functools.cache
+def _layout():
+    """Return (files, dirs): relative paths of the entries in _SCANNED_DIRS."""
+    files, dirs = set(), set()
+    for rel in _SCANNED_DIRS:
+        try:
+            entries = os.scandir(os.path.join(ROOT, rel))
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                path = f"{rel}/{entry.name}" if rel else entry.name
+                (dirs if entry.is_dir() else files).add(path)
+    return files, dirs
+
+
+@functools.cache
+def read_file_lower(relpath):
+    """Lowercased read_file(), for case-insensitive token checks."""
+    content = read_file(relpath)
+    return None if content is None else content.lower()
+
+
+def require_files(files):
+    """Skip the calling test if any of *files* is absent."""
+    missing = [f for f in files if read_file(f) is None]
+    if missing:
+        pytest.skip(f"missing files: {missing}")
+
+
+@functools.cache
+def read_presets():
+    """Parsed CMakePresets.json, or None if not found.
+
+    Parsed once per run and shared; tests must not modify it.
+    """
+    content = read_file("CMakePresets.json")
+    return None if content is None else _loads(content)
+
+
+@functools.cache
+def configure_presets_by_name():
+    """CMakePresets.json configure presets keyed by name (empty if not found)."""
+    presets = read_presets()
+    if presets is None:
+        return {}
+    return {p["name"]: p for p in presets["configurePresets"]}
+
+
+@functools.cache
+def visible_configure_names():
+    """Names of the non-hidden configure presets."""
+    return frozenset(
+        name for name, p in configure_presets_by_name().items() if not p.get("hidden")
+    )
+
+
+@functools.cache
+def ci_qt_versions():
+    """Qt versions in the ci.yml build matrix, one per cell, in file order."""
+    ci = read_file(".github/workflows/ci.yml")
+    return () if ci is None else tuple(_QT_VERSION_RE.findall(ci))
+
+
+def line_count(text):
+    """Number of lines once surrounding whitespace is stripped."""
+    return text.strip().count("\n") + 1
 
 
 def file_exists(relpath):
-    return os.path.exists(os.path.join(ROOT, relpath))
+    if os.path.dirname(relpath) not in _SCANNED_DIRS:
+        return os.path.exists(os.path.join(ROOT, relpath))
+    files, dirs = _layout()
+    return relpath in files or relpath in dirs
 
 
 def dir_exists(relpath):
-    return os.path.isdir(os.path.join(ROOT, relpath))
+    if os.path.dirname(relpath) not in _SCANNED_DIRS:
+        return os.path.isdir(os.path.join(ROOT, relpath))
+    return relpath in _layout()[1]
 
 
 # ============================================================
@@ -95,44 +196,34 @@ class TestPhase2_1_CMakePresets:
 
     @pytest.fixture
     def presets(self):
-        content = read_file("CMakePresets.json")
-        assert content is not None, "CMakePresets.json should exist"
-        return json.loads(content)
+        presets = read_presets()
+        assert presets is not None, "CMakePresets.json should exist"
+        return presets
 
     def test_no_vcpkg_references(self, presets):
-        raw = json.dumps(presets)
-        assert "vcpkg" not in raw.lower(), \
+        assert "vcpkg" not in read_file_lower("CMakePresets.json"), \
             "CMakePresets.json should have no vcpkg references"
 
-    def test_has_base_hidden_preset(self, presets):
-        configure = presets["configurePresets"]
-        base = [p for p in configure if p["name"] == "base"]
-        assert len(base) == 1, "Should have exactly one 'base' preset"
-        assert base[0].get("hidden") is True, "base preset should be hidden"
-
-    def test_has_four_configure_presets(self, presets):
-        visible = [p for p in presets["configurePresets"] if not p.get("hidden")]
-        names = {p["name"] for p in visible}
-        expected = {"debug", "release", "windows-debug", "windows-release"}
-        assert names == expected, \
-            f"Expected presets {expected}, got {names}"
-
-    def test_no_ci_only_presets(self, presets):
-        names = {p["name"] for p in presets["configurePresets"]}
-        assert "ci-linux" not in names, "ci-linux preset should not exist"
-        assert "ci-windows" not in names, "ci-windows preset should not exist"
-
-    def test_four_build_presets(self, presets):
-        names = {p["name"] for p in presets["buildPresets"]}
-        expected = {"debug", "release", "windows-debug", "windows-release"}
-        assert names == expected, \
-            f"Expected build presets {expected}, got {names}"
-
-    def test_four_test_presets(self, presets):
-        names = {p["name"] for p in presets["testPresets"]}
-        expected = {"debug", "release", "windows-debug", "windows-release"}
-        assert names == expected, \
-            f"Expected test presets {expected}, got {names}"
+    @pytest.fixture
+    def by_name(self, presets):
+        return configure_presets_by_name()
+
+    def test_has_base_hidden_preset(self, presets, by_name):
+        assert len(by_name) == len(presets["configurePresets"]), \
+            "Configure preset names should be unique"
+        assert "base" in by_name, "Should have a 'base' preset"
+        assert by_name["base"].get("hidden") is True, "base preset should be hidden"
+
+    @pytest.mark.parametrize(
+        "section", ["configurePresets", "buildPresets", "testPresets"])
+    def test_four_presets(self, presets, section):
+        names = {p["name"] for p in presets[section] if not p.get("hidden")}
+        assert names == _EXPECTED_PRESETS, \
+            f"Expected {section} {sorted(_EXPECTED_PRESETS)}, got {sorted(names)}"
+
+    def test_no_ci_only_presets(self, by_name):
+        assert "ci-linux" not in by_name, "ci-linux preset should not exist"
+        assert "ci-windows" not in by_name, "ci-windows preset should not exist"
 
     def test_windows_presets_have_vs_generator(self, presets):
         for p in presets["configurePresets"]:
@@ -140,13 +231,13 @@ class TestPhase2_1_CMakePresets:
                 assert "Visual Studio 17 2022" in p.get("generator", ""), \
                     f"Preset {p['name']} should use VS 2022 generator"
 
-    def test_base_preset_has_binary_and_install_dir(self, presets):
-        base = [p for p in presets["configurePresets"] if p["name"] == "base"][0]
+    def test_base_preset_has_binary_and_install_dir(self, by_name):
+        base = by_name["base"]
         assert "binaryDir" in base
         assert "installDir" in base
 
-    def test_base_preset_has_compile_commands(self, presets):
-        base = [p for p in presets["configurePresets"] if p["name"] == "base"][0]
+    def test_base_preset_has_compile_commands(self, by_name):
+        base = by_name["base"]
         cache = base.get("cacheVariables", {})
         assert cache.get("CMAKE_EXPORT_COMPILE_COMMANDS") == "ON"
 
@@ -160,61 +251,49 @@ class TestPhase2_2_RootCMakeLists:
         assert content is not None
         return content
 
-    def test_no_clang_tidy_option(self, cmake):
-        assert "QTPILOT_ENABLE_CLANG_TIDY" not in cmake, \
-            "QTPILOT_ENABLE_CLANG_TIDY option should be removed"
-
-    def test_no_deploy_qt_option(self, cmake):
-        assert "QTPILOT_DEPLOY_QT" not in cmake, \
-            "QTPILOT_DEPLOY_QT option should be removed"
+    # Options, dependencies and helpers the rewrite dropped
+    REMOVED_TOKENS = (
+        "QTPILOT_ENABLE_CLANG_TIDY",
+        "QTPILOT_DEPLOY_QT",
+        "nlohmann_json",
+        "spdlog",
+        "write_basic_package_version_file",
+        "function(qtpilot_deploy_qt",
+    )
+    REQUIRED_TOKENS = (
+        "find_package(Qt6",
+        "find_package(Qt5",
+        "QTPILOT_QT_VERSION_TAG",
+        "CMAKE_AUTOMOC",
+        "add_subdirectory(src/probe)",
+        "add_subdirectory(src/launcher)",
+        "add_subdirectory(tests)",
+    )
+
+    def test_removed_tokens_absent(self, cmake):
+        found = [tok for tok in self.REMOVED_TOKENS if tok in cmake]
+        assert not found, f"{found} should be removed"
+
+    def test_required_tokens_present(self, cmake):
+        missing = [tok for tok in self.REQUIRED_TOKENS if tok not in cmake]
+        assert not missing, f"{missing} should be present"
 
     def test_no_windeployqt(self, cmake):
-        assert "windeployqt" not in cmake.lower(), \
+        assert "windeployqt" not in read_file_lower("CMakeLists.txt"), \
             "windeployqt references should be removed"
 
-    def test_no_nlohmann_json(self, cmake):
-        assert "nlohmann_json" not in cmake, \
-            "nlohmann_json references should be removed"
-
-    def test_no_spdlog(self, cmake):
-        assert "spdlog" not in cmake, \
-            "spdlog references should be removed"
-
-    def test_no_write_basic_package_version_file(self, cmake):
-        assert "write_basic_package_version_file" not in cmake, \
-            "write_basic_package_version_file call should be removed"
-
     def test_flat_install_path(self, cmake):
         # Should use "lib" not "lib/qtpilot/${QTPILOT_QT_VERSION_TAG}"
-        assert '"lib"' in cmake or "'lib'" in cmake, \
+        assert any(tok in cmake for tok in ('"lib"', "'lib'")), \
             "Install path should be flat 'lib', not versioned"
         assert "lib/qtpilot/" not in cmake, \
             "Versioned lib/qtpilot/ path should be removed"
 
-    def test_has_qt_detection(self, cmake):
-        assert "find_package(Qt6" in cmake
-        assert "find_package(Qt5" in cmake
-
-    def test_has_qt_version_tag(self, cmake):
-        assert "QTPILOT_QT_VERSION_TAG" in cmake
-
     def test_has_compiler_warnings(self, cmake):
-        assert "-Wall" in cmake or "/W4" in cmake
-
-    def test_has_automoc(self, cmake):
-        assert "CMAKE_AUTOMOC" in cmake
-
-    def test_has_subdirectories(self, cmake):
-        assert "add_subdirectory(src/probe)" in cmake
-        assert "add_subdirectory(src/launcher)" in cmake
-        assert "add_subdirectory(tests)" in cmake
-
-    def test_no_qtpilot_deploy_qt_function(self, cmake):
-        assert "function(qtpilot_deploy_qt" not in cmake, \
-            "qtpilot_deploy_qt function definition should be removed"
+        assert any(flag in cmake for flag in ("-Wall", "/W4"))
 
     def test_line_count_reduced(self, cmake):
-        lines = len(cmake.strip().split("\n"))
+        lines = line_count(cmake)
         assert lines < 300, \
             f"Root CMakeLists.txt should be ~200 lines, got {lines}"
 
@@ -233,9 +312,9 @@ class TestPhase2_3_TestsCMakeLists:
             "Should define qtPilot_add_test helper function"
 
     def test_uses_helper_for_tests(self, cmake):
-        calls = re.findall(r"qtPilot_add_test\(", cmake)
-        assert len(calls) >= 13, \
-            f"Should have at least 13 qtPilot_add_test calls, found {len(calls)}"
+        calls = cmake.count("qtPilot_add_test(")
+        assert calls >= 13, \
+            f"Should have at least 13 qtPilot_add_test calls, found {calls}"
 
     def test_all_test_names_present(self, cmake):
         expected_tests = [
@@ -253,15 +332,15 @@ class TestPhase2_3_TestsCMakeLists:
             "test_model_navigator",
             "test_event_capture",
         ]
-        for test in expected_tests:
-            assert test in cmake, f"Test '{test}' should be present"
+        missing = set(expected_tests) - set(_TEST_NAME_RE.findall(cmake))
+        assert not missing, f"Tests {sorted(missing)} should be present"
 
     def test_qminimal_deployment_kept(self, cmake):
         assert "qminimald.dll" in cmake, \
             "qminimal.dll deployment block should be kept"
 
     def test_line_count_reduced(self, cmake):
-        lines = len(cmake.strip().split("\n"))
+        lines = line_count(cmake)
         assert lines < 150, \
             f"tests/CMakeLists.txt should be ~60-110 lines, got {lines}"
 
@@ -269,9 +348,8 @@ class TestPhase2_3_TestsCMakeLists:
         # The helper function should handle Qt linking; we shouldn't have
         # multiple manual if(QT_VERSION_MAJOR EQUAL 6) blocks for test targets
         # outside the function definition
-        outside_function = cmake.split("endfunction()")[1] if "endfunction()" in cmake else ""
-        qt_blocks = re.findall(r"if\(QT_VERSION_MAJOR EQUAL 6\)", outside_function)
-        assert len(qt_blocks) == 0, \
+        outside_function = cmake.partition("endfunction()")[2]
+        assert "if(QT_VERSION_MAJOR EQUAL 6)" not in outside_function, \
             "Should not have Qt version checks outside the helper function for test targets"
 
 
@@ -359,7 +437,7 @@ class TestPhase2_7_qtPilotConfigCmake:
         assert "lib/qtpilot/" not in cmake, \
             "Versioned lib/qtpilot/ path should be removed"
         # Should reference just lib/
-        assert '${QTPILOT_PREFIX}/lib"' in cmake or "${QTPILOT_PREFIX}/lib" in cmake
+        assert "${QTPILOT_PREFIX}/lib" in cmake
 
     def test_has_imported_target(self, cmake):
         assert "qtPilot::Probe" in cmake
@@ -368,7 +446,7 @@ class TestPhase2_7_qtPilotConfigCmake:
         assert "INTERFACE_INCLUDE_DIRECTORIES" in cmake
 
     def test_line_count_reduced(self, cmake):
-        lines = len(cmake.strip().split("\n"))
+        lines = line_count(cmake)
         assert lines < 140, \
             f"qtPilotConfig.cmake.in should be ~80-125 lines, got {lines}"
 
@@ -437,20 +515,20 @@ class TestPhase3_1_NewCIWorkflow:
 
     def test_build_matrix_has_8_cells(self, ci):
         # 4 Qt versions x 2 platforms
-        qt_versions = re.findall(r'qt:\s*"?([0-9]+\.[0-9]+\.[0-9]+)"?', ci)
+        qt_versions = ci_qt_versions()
         assert len(qt_versions) == 8, \
             f"Build matrix should have 8 entries (4 Qt x 2 platforms), found {len(qt_versions)}"
 
     def test_build_matrix_qt_versions(self, ci):
-        for version in ["5.15.2", "6.5.3", "6.8.0", "6.9.0"]:
-            assert version in ci, f"Qt {version} should be in the build matrix"
+        missing = {"5.15.2", "6.5.3", "6.8.0", "6.9.0"} - set(ci_qt_versions())
+        assert not missing, f"Qt {sorted(missing)} should be in the build matrix"
 
     def test_uses_install_qt_action(self, ci):
         assert "jurplel/install-qt-action" in ci, \
             "Should use install-qt-action instead of vcpkg"
 
     def test_no_vcpkg_references(self, ci):
-        assert "vcpkg" not in ci.lower(), \
+        assert "vcpkg" not in read_file_lower(".github/workflows/ci.yml"), \
             "CI should have no vcpkg references"
 
     def test_no_continue_on_error(self, ci):
@@ -498,7 +576,7 @@ class TestPhase3_2_NewReleaseWorkflow:
         assert "softprops/action-gh-release" in release
 
     def test_generates_checksums(self, release):
-        assert "SHA256SUMS" in release or "sha256sum" in release
+        assert any(tok in release for tok in ("SHA256SUMS", "sha256sum"))
 
     def test_extracts_launcher(self, release):
         assert "qtPilot-launcher" in release
@@ -518,94 +596,65 @@ class TestPhase3_3_PublishPyPIKept:
 class TestConsistency:
     """Cross-cutting checks for consistency across all files."""
 
+    VCPKG_FILES = (
+        "CMakeLists.txt",
+        "CMakePresets.json",
+        "tests/CMakeLists.txt",
+        "src/probe/CMakeLists.txt",
+        "src/launcher/CMakeLists.txt",
+        "test_app/CMakeLists.txt",
+        "cmake/qtPilotConfig.cmake.in",
+        ".github/workflows/ci.yml",
+        ".github/workflows/release.yml",
+    )
+    DEPLOY_QT_FILES = (
+        "src/probe/CMakeLists.txt",
+        "src/launcher/CMakeLists.txt",
+        "test_app/CMakeLists.txt",
+    )
+    THIRD_PARTY_FILES = (
+        "CMakeLists.txt",
+        "src/probe/CMakeLists.txt",
+    )
+
+    def test_checked_files_exist(self):
+        files = {*self.VCPKG_FILES, *self.DEPLOY_QT_FILES,
+                 *self.THIRD_PARTY_FILES}
+        missing = sorted(f for f in files if read_file(f) is None)
+        if missing:
+            pytest.fail(f"consistency checks need missing files: {missing}")
+
     def test_no_vcpkg_anywhere(self):
         """No vcpkg references in any build/CI file."""
-        files_to_check = [
-            "CMakeLists.txt",
-            "CMakePresets.json",
-            "tests/CMakeLists.txt",
-            "src/probe/CMakeLists.txt",
-            "src/launcher/CMakeLists.txt",
-            "test_app/CMakeLists.txt",
-            "cmake/qtPilotConfig.cmake.in",
-            ".github/workflows/ci.yml",
-            ".github/workflows/release.yml",
-        ]
-        for f in files_to_check:
-            content = read_file(f)
-            if content:
-                assert "vcpkg" not in content.lower(), \
-                    f"{f} should have no vcpkg references"
+        require_files(self.VCPKG_FILES)
+        offenders = [f for f in self.VCPKG_FILES
+                     if "vcpkg" in read_file_lower(f)]
+        assert not offenders, f"vcpkg references found in {offenders}"
 
     def test_no_deploy_qt_anywhere(self):
         """No qtpilot_deploy_qt calls in any CMakeLists."""
-        files_to_check = [
-            "src/probe/CMakeLists.txt",
-            "src/launcher/CMakeLists.txt",
-            "test_app/CMakeLists.txt",
-        ]
-        for f in files_to_check:
-            content = read_file(f)
-            if content:
-                assert "qtpilot_deploy_qt" not in content, \
-                    f"{f} should have no qtpilot_deploy_qt calls"
+        require_files(self.DEPLOY_QT_FILES)
+        offenders = [f for f in self.DEPLOY_QT_FILES
+                     if "qtpilot_deploy_qt" in read_file(f)]
+        assert not offenders, f"qtpilot_deploy_qt calls found in {offenders}"
 
     def test_no_nlohmann_or_spdlog_anywhere(self):
         """No nlohmann_json or spdlog in any build file."""
-        files_to_check = [
-            "CMakeLists.txt",
-            "src/probe/CMakeLists.txt",
-        ]
-        for f in files_to_check:
-            content = read_file(f)
-            if content:
-                assert "nlohmann_json" not in content, \
-                    f"{f} should have no nlohmann_json references"
-                assert "spdlog" not in content, \
-                    f"{f} should have no spdlog references"
+        require_files(self.THIRD_PARTY_FILES)
+        offenders = [f for f in self.THIRD_PARTY_FILES
+                     if any(dep in read_file(f)
+                            for dep in ("nlohmann_json", "spdlog"))]
+        assert not offenders, \
+            f"nlohmann_json/spdlog references found in {offenders}"
 
     def test_preset_names_match_ci(self):
         """CI workflow preset names match CMakePresets.json."""
-        presets_json = read_file("CMakePresets.json")
+        presets = read_presets()
         ci = read_file(".github/workflows/ci.yml")
-        assert presets_json and ci
+        assert presets and ci
 
-        presets = json.loads(presets_json)
-        preset_names = {p["name"] for p in presets["configurePresets"] if not p.get("hidden")}
+        preset_names = visible_configure_names()
 
         # CI should reference release and windows-release
         assert "release" in preset_names
         assert "windows-release" in preset_names
-
-
-# ============================================================
-# File statistics
-# ============================================================
-
-class TestFileStatistics:
-    """Verify file sizes are in the expected range after simplification."""
-
-    def test_cmake_presets_reasonable_size(self):
-        content = read_file("CMakePresets.json")
-        if content:
-            data = json.loads(content)
-            n_configure = len([p for p in data["configurePresets"] if not p.get("hidden")])
-            assert n_configure == 4, f"Expected 4 visible configure presets, got {n_configure}"
-
-    def test_root_cmake_under_300_lines(self):
-        content = read_file("CMakeLists.txt")
-        if content:
-            lines = len(content.strip().split("\n"))
-            assert lines < 300, f"Root CMakeLists.txt has {lines} lines, target is ~200"
-
-    def test_tests_cmake_under_150_lines(self):
-        content = read_file("tests/CMakeLists.txt")
-        if content:
-            lines = len(content.strip().split("\n"))
-            assert lines < 150, f"tests/CMakeLists.txt has {lines} lines, target is ~60"
-
-    def test_config_cmake_under_140_lines(self):
-        content = read_file("cmake/qtPilotConfig.cmake.in")
-        if content:
-            lines = len(content.strip().split("\n"))
-            assert lines < 140, f"qtPilotConfig.cmake.in has {lines} lines, target is ~80"